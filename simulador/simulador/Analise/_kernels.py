@@ -0,0 +1,170 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorador(funcao):
+            return funcao
+        if args and callable(args[0]):
+            return args[0]
+        return decorador
+
+
+@njit(cache=True)
+def soma_disponibilidade_por_node(src, dst, bloqueada, out_soma, out_contagem):
+    for i in range(len(src)):
+        ok = 1 - bloqueada[i]
+        out_soma[src[i]] += ok
+        out_soma[dst[i]] += ok
+        out_contagem[src[i]] += 1
+        out_contagem[dst[i]] += 1
+
+
+@njit(cache=True)
+def soma_slots_por_node(src, dst, slots, bloqueada, tempos, inicio, fim, out):
+    for i in range(len(src)):
+        if bloqueada[i] or tempos[i] < inicio or tempos[i] >= fim:
+            continue
+        out[src[i]] += slots[i]
+        out[dst[i]] += slots[i]
+
+
+@njit(cache=True)
+def max_flow_min_cut(indptr, indices, rev, cap, s, t):
+    # Edmonds-Karp sobre a adjacencia CSR: BFS por caminho aumentante em
+    # arrays planos, sem os dicts de residual do networkx. Devolve o valor
+    # do corte e a mascara de nodes alcancaveis a partir de s no residual
+    n = indptr.size - 1
+    residual = cap.copy()
+    fila = np.empty(n, np.int64)
+    pred_node = np.empty(n, np.int64)
+    pred_arco = np.empty(n, np.int64)
+    total = 0
+
+    while True:
+        pred_node[:] = -1
+        pred_node[s] = s
+        fila[0] = s
+        inicio = 0
+        fim = 1
+        achou = False
+        while inicio < fim and not achou:
+            u = fila[inicio]
+            inicio += 1
+            for arco in range(indptr[u], indptr[u + 1]):
+                v = indices[arco]
+                if residual[arco] > 0 and pred_node[v] == -1:
+                    pred_node[v] = u
+                    pred_arco[v] = arco
+                    if v == t:
+                        achou = True
+                        break
+                    fila[fim] = v
+                    fim += 1
+        if not achou:
+            break
+
+        gargalo = residual[pred_arco[t]]
+        v = t
+        while v != s:
+            arco = pred_arco[v]
+            if residual[arco] < gargalo:
+                gargalo = residual[arco]
+            v = pred_node[v]
+        v = t
+        while v != s:
+            arco = pred_arco[v]
+            residual[arco] -= gargalo
+            residual[rev[arco]] += gargalo
+            v = pred_node[v]
+        total += gargalo
+
+    return total, pred_node >= 0
+
+
+@njit(cache=True)
+def caminho_sem_falha(failed, edge_ids):
+    # equivalente a not failed[edge_ids].any(), mas sem o custo de dispatch
+    # do fancy indexing para os arrays curtos (<= 10 hops) do roteamento
+    for i in range(edge_ids.size):
+        if failed[edge_ids[i]]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def caminho_usa_aresta(edge_ids, edge_id):
+    for i in range(edge_ids.size):
+        if edge_ids[i] == edge_id:
+            return True
+    return False
+
+
+@njit(cache=True)
+def primeira_janela_livre(slot_words, edge_ids, tamanho, numero_de_slots):
+    # first-fit sobre o espelho bit-packed: a uniao da ocupacao do caminho
+    # sai em um OR de palavras uint64 por hop, e palavras totalmente livres
+    # ou totalmente cheias avancam 64 slots de uma vez; so palavras mistas
+    # caem no laco por bit. -1 se nao ha janela do tamanho pedido
+    cheia = np.uint64(0xFFFFFFFFFFFFFFFF)
+    um = np.uint64(1)
+    corrida = 0
+    indice = 0
+    for indice_palavra in range(slot_words.shape[1]):
+        palavra = np.uint64(0)
+        for i in range(edge_ids.size):
+            palavra |= slot_words[edge_ids[i], indice_palavra]
+        bits = numero_de_slots - indice
+        if bits > 64:
+            bits = 64
+        if palavra == 0:
+            if corrida + bits >= tamanho:
+                return indice - corrida
+            corrida += bits
+            indice += bits
+            continue
+        if palavra == cheia:
+            corrida = 0
+            indice += bits
+            continue
+        for bit in range(bits):
+            if (palavra >> np.uint64(bit)) & um:
+                corrida = 0
+            else:
+                corrida += 1
+                if corrida == tamanho:
+                    return indice + bit - tamanho + 1
+        indice += bits
+    return -1
+
+
+def aquece_kernels() -> None:
+    # paga o custo de compilacao do numba uma unica vez, fora do caminho quente
+    if not NUMBA_DISPONIVEL:
+        return
+    um = np.zeros(1, dtype=np.int64)
+    soma_disponibilidade_por_node(um, um, np.zeros(1, np.int8), np.zeros(1, np.float64), np.zeros(1, np.int64))
+    soma_slots_por_node(um, um, um, np.zeros(1, np.int8), np.zeros(1, np.float64), 0.0, 0.0, np.zeros(1, np.int64))
+    soma_disponibilidade_por_distancia(um, um, np.zeros(1, np.int8), np.zeros((1, 1), np.int32),
+                                       np.zeros(1, np.int32), np.zeros(1, np.float64), np.zeros(1, np.int64))
+    max_flow_min_cut(np.array([0, 1, 2], np.int64), np.array([1, 0], np.int64),
+                     np.array([1, 0], np.int64), np.ones(2, np.int64), 0, 1)
+    ids = np.zeros(1, np.int32)
+    caminho_sem_falha(np.zeros(1, np.bool_), ids)
+    caminho_usa_aresta(ids, 0)
+    primeira_janela_livre(np.zeros((1, 1), np.uint64), ids, 1, 1)
+
+
+@njit(cache=True)
+def soma_disponibilidade_por_distancia(src, dst, bloqueada, matriz_distancias, node_idx, out_soma, out_contagem):
+    for i in range(len(src)):
+        distancia = matriz_distancias[node_idx[src[i]], node_idx[dst[i]]]
+        if distancia < 0:
+            continue
+        out_soma[distancia] += 1 - bloqueada[i]
+        out_contagem[distancia] += 1
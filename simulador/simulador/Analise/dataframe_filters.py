@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+# todos os filtros devolvem o resultado da indexacao sem .copy(): os
+# consumidores de analise so leem o recorte. Quem precisar mutar o
+# resultado deve chamar .copy() no ponto de uso.
+
+
+def filter_blocked_only(dataframe: pd.DataFrame) -> pd.DataFrame:
+    return dataframe.loc[dataframe["bloqueada"]]
+
+
+def filter_accepted_only(dataframe: pd.DataFrame) -> pd.DataFrame:
+    return dataframe.loc[~dataframe["bloqueada"]]
+
+
+def _time_slice(dataframe: pd.DataFrame, inicio: float, fim: float) -> pd.DataFrame:
+    # assume dataframe ordenado por tempo_criacao (garantido pelo Registrador);
+    # dois searchsorted O(log N) no lugar de duas mascaras booleanas O(N)
+    tempos = dataframe["tempo_criacao"].to_numpy()
+    i = np.searchsorted(tempos, inicio, "left") if inicio is not None else 0
+    j = np.searchsorted(tempos, fim, "left") if fim is not None else len(tempos)
+    return dataframe.iloc[i:j]
+
+
+def filter_before_disaster(dataframe: pd.DataFrame, inicio_desastre: float) -> pd.DataFrame:
+    return _time_slice(dataframe, None, inicio_desastre)
+
+
+def filter_during_disaster(dataframe: pd.DataFrame, inicio_desastre: float, fim_desastre: float) -> pd.DataFrame:
+    return _time_slice(dataframe, inicio_desastre, fim_desastre)
+
+
+def filter_after_disaster(dataframe: pd.DataFrame, fim_desastre: float) -> pd.DataFrame:
+    return _time_slice(dataframe, fim_desastre, None)
+
+
+# base da chave composta (src, dst) -> src * _MAX_NODES + dst; precisa apenas
+# ser maior que o maior id de node da topologia
+_MAX_NODES = 1024
+
+
+def filter_by_link(dataframe: pd.DataFrame, link: tuple[int, int]) -> pd.DataFrame:
+
+    ponto_a, ponto_b = link
+    pares = dataframe["src"].to_numpy().astype(np.int64) * _MAX_NODES + dataframe["dst"].to_numpy()
+    chaves = np.array([ponto_a * _MAX_NODES + ponto_b, ponto_b * _MAX_NODES + ponto_a], dtype=np.int64)
+    return dataframe.loc[np.isin(pares, chaves)]
+
+
+def create_time_windows(dataframe: pd.DataFrame, window_size: float, start_time: float, end_time: float) -> dict[int, pd.DataFrame]:
+
+    # uma unica passada com pd.cut no lugar de uma varredura por janela
+    bins = np.arange(start_time, end_time + window_size, window_size)
+    janelas = pd.cut(dataframe["tempo_criacao"], bins=bins, labels=False, right=False, include_lowest=True)
+    return {int(janela): grupo for janela, grupo in dataframe.groupby(janelas) if len(grupo) > 0}
+
+
+def filter_extra_component_traffic(dataframe: pd.DataFrame, componente1: list[int], componente2: list[int]) -> pd.DataFrame:
+
+    comp1_set = set(componente1)
+    comp2_set = set(componente2)
+
+    src_em_comp1 = dataframe["src"].isin(comp1_set)
+    dst_em_comp1 = dataframe["dst"].isin(comp1_set)
+    src_em_comp2 = dataframe["src"].isin(comp2_set)
+    dst_em_comp2 = dataframe["dst"].isin(comp2_set)
+
+    mask = (src_em_comp1 & dst_em_comp2) | (src_em_comp2 & dst_em_comp1)
+    return dataframe.loc[mask]
+
+
+def filter_intra_component_traffic(dataframe: pd.DataFrame, componente: list[int]) -> pd.DataFrame:
+
+    comp_set = set(componente)
+
+    mask = dataframe["src"].isin(comp_set) & dataframe["dst"].isin(comp_set)
+    return dataframe.loc[mask]
@@ -0,0 +1,60 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+from simpy import Environment
+
+from Cenario.Cenario import Cenario
+from Registrador import Registrador
+from Simulador import Simulador
+
+CAMINHO_TOPOLOGIA = "../topology/usa"
+
+# estado carregado uma unica vez por worker pelo initializer do pool,
+# para nao pagar leitura de topologia e warmup por tarefa
+_topologia_do_worker: nx.Graph = None
+
+
+def _init_worker() -> None:
+    global _topologia_do_worker
+    _topologia_do_worker = nx.read_weighted_edgelist(CAMINHO_TOPOLOGIA, nodetype=int)
+
+    from Analise._kernels import aquece_kernels
+    aquece_kernels()
+
+
+def _topologia_base() -> nx.Graph:
+    if _topologia_do_worker is not None:
+        return _topologia_do_worker.copy()
+    return nx.read_weighted_edgelist(CAMINHO_TOPOLOGIA, nodetype=int)
+
+
+def salvar_cenario_para_experimento(cenario: Cenario, caminho: str) -> None:
+    # protocolo 5 serializa buffers grandes out-of-band, mais rapido e menor
+    with open(caminho, 'wb') as f:
+        pickle.dump(cenario, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def run_scenario_experiment(argumentos: tuple[str, str]) -> str:
+    caminho_cenario, caminho_dataframe = argumentos
+
+    cenario = Cenario.carrega_cenario(caminho_cenario)
+    Registrador.reseta_registrador()
+
+    env = Environment()
+    simulador = Simulador(env=env, topology=_topologia_base(), cenario=cenario)
+    simulador.run()
+
+    simulador.salvar_dataframe(caminho_dataframe)
+    return caminho_dataframe
+
+
+def run_scenario_experiments(lista_de_argumentos: list[tuple[str, str]], workers: int = None) -> list[str]:
+    # os workers recebem apenas caminhos e reconstroem o cenario localmente,
+    # evitando serializar o objeto Cenario inteiro por tarefa; map com
+    # chunksize amortiza o custo de fila/IPC por lote em vez de por submit
+    workers = workers or os.cpu_count()
+    chunksize = max(1, len(lista_de_argumentos) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        return list(executor.map(run_scenario_experiment, lista_de_argumentos, chunksize=chunksize))
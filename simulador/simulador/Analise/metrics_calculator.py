@@ -0,0 +1,198 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from Analise._kernels import (
+    NUMBA_DISPONIVEL,
+    soma_disponibilidade_por_distancia,
+    soma_disponibilidade_por_node,
+    soma_slots_por_node,
+)
+
+# abaixo desse tamanho o custo de compilacao/conversao nao compensa o kernel
+_TAMANHO_MINIMO_PARA_KERNEL = 100_000
+
+
+def _node_idx_como_array(node_to_idx: dict[int, int]) -> np.ndarray:
+    node_idx = np.full(max(node_to_idx) + 1, -1, dtype=np.int32)
+    for node, idx in node_to_idx.items():
+        node_idx[node] = idx
+    return node_idx
+
+
+_apsp_cache: dict[int, tuple[np.ndarray, dict[int, int]]] = {}
+
+
+def _apsp(topology: nx.Graph) -> tuple[np.ndarray, dict[int, int]]:
+    # matriz V x V de distancias calculada uma unica vez por topologia,
+    # reutilizada entre as chamadas de analise sobre o mesmo grafo
+    chave = id(topology)
+    if chave not in _apsp_cache:
+        nodes = list(topology.nodes())
+        node_to_idx = {node: idx for idx, node in enumerate(nodes)}
+        matriz = np.full((len(nodes), len(nodes)), -1, dtype=np.int32)
+        for origem, distancias in nx.all_pairs_shortest_path_length(topology):
+            linha = node_to_idx[origem]
+            for destino, distancia in distancias.items():
+                matriz[linha, node_to_idx[destino]] = distancia
+        _apsp_cache[chave] = (matriz, node_to_idx)
+    return _apsp_cache[chave]
+
+
+def _distancias_topologicas(dataframe: pd.DataFrame, topology: nx.Graph) -> np.ndarray:
+    matriz, node_to_idx = _apsp(topology)
+    src = dataframe["src"].to_numpy()
+    dst = dataframe["dst"].to_numpy()
+    return np.fromiter(
+        (matriz[node_to_idx[s], node_to_idx[d]] for s, d in zip(src, dst)),
+        dtype=np.int32, count=len(dataframe)
+    )
+
+
+def calculate_average_distance_between_groups(topology: nx.Graph, group1: list[int], group2: list[int]) -> float:
+
+    matriz, node_to_idx = _apsp(topology)
+    idx1 = np.fromiter((node_to_idx[node] for node in group1), dtype=np.intp, count=len(group1))
+    idx2 = np.fromiter((node_to_idx[node] for node in group2), dtype=np.intp, count=len(group2))
+    distancias = matriz[np.ix_(idx1, idx2)]
+    validas = distancias >= 0
+    return float(distancias[validas].mean()) if validas.any() else 0.0
+
+
+def split_by_distance(dataframe: pd.DataFrame, topology: nx.Graph) -> dict[int, pd.DataFrame]:
+
+    distancias = _distancias_topologicas(dataframe, topology)
+    validas = distancias >= 0
+    return {int(distancia): grupo for distancia, grupo in dataframe[validas].groupby(distancias[validas])}
+
+
+def split_by_node(dataframe: pd.DataFrame) -> dict[int, pd.DataFrame]:
+
+    # empilha src e dst em uma tabela (node, idx) unica e agrupa em uma passada
+    empilhado = pd.concat([
+        dataframe[["src"]].rename(columns={"src": "node"}).assign(idx=dataframe.index),
+        dataframe[["dst"]].rename(columns={"dst": "node"}).assign(idx=dataframe.index),
+    ])
+    return {int(node): dataframe.loc[grupo["idx"].unique()] for node, grupo in empilhado.groupby("node")}
+
+
+def calculate_availability_by_node(dataframe: pd.DataFrame) -> dict[int, float]:
+
+    if NUMBA_DISPONIVEL and len(dataframe) >= _TAMANHO_MINIMO_PARA_KERNEL:
+        src = dataframe["src"].to_numpy(np.int64)
+        dst = dataframe["dst"].to_numpy(np.int64)
+        maior_node = int(max(src.max(), dst.max()))
+        soma = np.zeros(maior_node + 1, dtype=np.float64)
+        contagem = np.zeros(maior_node + 1, dtype=np.int64)
+        soma_disponibilidade_por_node(src, dst, dataframe["bloqueada"].to_numpy(np.int8), soma, contagem)
+        nodes = np.flatnonzero(contagem)
+        return dict(zip(nodes.tolist(), (soma[nodes] / contagem[nodes]).tolist()))
+
+    nao_bloqueada = (~dataframe["bloqueada"]).astype(np.int8).to_numpy()
+    empilhado = pd.DataFrame({
+        "node": np.concatenate([dataframe["src"].to_numpy(), dataframe["dst"].to_numpy()]),
+        "ok": np.concatenate([nao_bloqueada, nao_bloqueada]),
+    })
+    return empilhado.groupby("node")["ok"].mean().to_dict()
+
+
+def _avail_by_node_split(dataframe: pd.DataFrame, inicio_desastre: float, fim_desastre: float) -> tuple[dict[int, float], dict[int, float]]:
+    # uma unica passada empilhada com fase categorizada devolve os dois
+    # dicionarios de disponibilidade (antes e durante) de uma vez
+    tempos = dataframe["tempo_criacao"].to_numpy()
+    fase = np.where(tempos < inicio_desastre, 0, np.where(tempos < fim_desastre, 1, 2))
+    nao_bloqueada = (~dataframe["bloqueada"]).astype(np.int8).to_numpy()
+
+    empilhado = pd.DataFrame({
+        "node": np.concatenate([dataframe["src"].to_numpy(), dataframe["dst"].to_numpy()]),
+        "fase": np.concatenate([fase, fase]),
+        "ok": np.concatenate([nao_bloqueada, nao_bloqueada]),
+    })
+    por_fase = empilhado[empilhado["fase"] < 2].groupby(["fase", "node"])["ok"].mean()
+    antes = por_fase.get(0, pd.Series(dtype=np.float64)).to_dict()
+    durante = por_fase.get(1, pd.Series(dtype=np.float64)).to_dict()
+    return antes, durante
+
+
+def calculate_delta_availability(dataframe: pd.DataFrame, inicio_desastre: float, fim_desastre: float) -> dict[int, float]:
+
+    antes, durante = _avail_by_node_split(dataframe, inicio_desastre, fim_desastre)
+    return {node: durante.get(node, 0.0) - disponibilidade for node, disponibilidade in antes.items()}
+
+
+def calculate_availability_ratio(dataframe: pd.DataFrame, inicio_desastre: float, fim_desastre: float) -> dict[int, float]:
+
+    antes, durante = _avail_by_node_split(dataframe, inicio_desastre, fim_desastre)
+    return {node: durante.get(node, 0.0) / disponibilidade for node, disponibilidade in antes.items() if disponibilidade > 0}
+
+
+_avail_by_node_cache: dict[int, dict[int, float]] = {}
+
+
+def availability_by_node_cached(dataframe: pd.DataFrame) -> dict[int, float]:
+    # os reporters chamam a mesma agregacao varias vezes para o mesmo frame
+    # (sumario, fases, estatisticas por node); cacheia por id do objeto
+    chave = id(dataframe)
+    if chave not in _avail_by_node_cache:
+        _avail_by_node_cache[chave] = calculate_availability_by_node(dataframe)
+    return _avail_by_node_cache[chave]
+
+
+def get_slots_allocated_during_disaster(dataframe: pd.DataFrame, inicio_desastre: float, fim_desastre: float) -> dict[int, int]:
+
+    if NUMBA_DISPONIVEL and len(dataframe) >= _TAMANHO_MINIMO_PARA_KERNEL:
+        src = dataframe["src"].to_numpy(np.int64)
+        dst = dataframe["dst"].to_numpy(np.int64)
+        maior_node = int(max(src.max(), dst.max()))
+        slots = dataframe["numero_de_slots"].fillna(0).to_numpy(np.int64)
+        out = np.zeros(maior_node + 1, dtype=np.int64)
+        soma_slots_por_node(src, dst, slots, dataframe["bloqueada"].to_numpy(np.int8),
+                            dataframe["tempo_criacao"].to_numpy(np.float64), inicio_desastre, fim_desastre, out)
+        nodes = np.flatnonzero(out)
+        return dict(zip(nodes.tolist(), out[nodes].tolist()))
+
+    durante = dataframe[
+        (dataframe["tempo_criacao"] >= inicio_desastre) &
+        (dataframe["tempo_criacao"] < fim_desastre) &
+        (~dataframe["bloqueada"])
+    ]
+    slots = durante["numero_de_slots"].to_numpy()
+    empilhado = pd.DataFrame({
+        "node": np.concatenate([durante["src"].to_numpy(), durante["dst"].to_numpy()]),
+        "slots": np.concatenate([slots, slots]),
+    })
+    return empilhado.groupby("node")["slots"].sum().to_dict()
+
+
+def calculate_blocking_rate_by_time_bucket(dataframe: pd.DataFrame, bucket_size: float) -> dict[int, float]:
+
+    buckets = (dataframe["tempo_criacao"].to_numpy() // bucket_size).astype(np.int64)
+    return dataframe["bloqueada"].groupby(buckets).mean().to_dict()
+
+
+def calculate_availability_by_distance(dataframe: pd.DataFrame, topology: nx.Graph) -> dict[int, float]:
+
+    if NUMBA_DISPONIVEL and len(dataframe) >= _TAMANHO_MINIMO_PARA_KERNEL:
+        matriz, node_to_idx = _apsp(topology)
+        soma = np.zeros(matriz.max() + 1, dtype=np.float64)
+        contagem = np.zeros(matriz.max() + 1, dtype=np.int64)
+        soma_disponibilidade_por_distancia(
+            dataframe["src"].to_numpy(np.int64), dataframe["dst"].to_numpy(np.int64),
+            dataframe["bloqueada"].to_numpy(np.int8), matriz,
+            _node_idx_como_array(node_to_idx), soma, contagem
+        )
+        distancias = np.flatnonzero(contagem)
+        return dict(zip(distancias.tolist(), (soma[distancias] / contagem[distancias]).tolist()))
+
+    distancias = _distancias_topologicas(dataframe, topology)
+    validas = distancias >= 0
+    disponivel = (~dataframe["bloqueada"]).astype(np.float64)
+    return disponivel[validas].groupby(distancias[validas]).mean().to_dict()
+
+
+def calculate_standard_deviation_by_distance(dataframe: pd.DataFrame, topology: nx.Graph) -> dict[int, float]:
+
+    distancias = _distancias_topologicas(dataframe, topology)
+    validas = distancias >= 0
+    disponivel = (~dataframe["bloqueada"]).astype(np.float32)
+    return disponivel[validas].groupby(distancias[validas]).std(ddof=0).to_dict()
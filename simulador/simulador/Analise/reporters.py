@@ -0,0 +1,125 @@
+import sys
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from Analise import metrics_calculator
+
+# networkx so e usado por print_topology_summary; importado la dentro para
+# nao inflar o cold-start de quem so imprime sumarios
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+def print_scenario_comparison(dataframes: dict[str, pd.DataFrame]) -> None:
+
+    metrics = {}
+    for nome, dataframe in dataframes.items():
+        # uma unica varredura da coluna bloqueada por cenario; as demais
+        # metricas sao derivadas aritmeticamente
+        arr = dataframe["bloqueada"].to_numpy()
+        bloqueadas = int(np.count_nonzero(arr))
+        total = arr.size
+        taxa = bloqueadas / total if total else 0.0
+        metrics[nome] = {
+            "total de requisicoes": total,
+            "requisicoes bloqueadas": bloqueadas,
+            "taxa de bloqueio": taxa,
+            "disponibilidade": 1 - taxa,
+        }
+
+    nomes = list(metrics)
+    # monta o relatorio inteiro e emite com um unico write, sem um flush
+    # de stdout por linha nem concatenacao repetida de strings
+    lines = ["  " + f"{'metrica':<30}" + "".join(f" {nome:>19}" for nome in nomes)]
+    for metric_name in next(iter(metrics.values())):
+        parts = [f"  {metric_name:<30}"]
+        parts.extend(f" {metrics[nome][metric_name]:>19.4f}" for nome in nomes)
+        lines.append("".join(parts))
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_topology_summary(topology: 'nx.Graph') -> None:
+    import networkx as nx
+
+    numero_de_nodes = topology.number_of_nodes()
+    numero_de_edges = topology.number_of_edges()
+    print(f"Nodes: {numero_de_nodes}")
+    print(f"Links: {numero_de_edges}")
+
+    # um unico array int32 alimenta as tres estatisticas de grau
+    graus = np.fromiter((grau for _, grau in topology.degree()), dtype=np.int32, count=numero_de_nodes)
+    print(f"Grau medio: {graus.mean():.2f}")
+    print(f"Grau minimo: {graus.min()}")
+    print(f"Grau maximo: {graus.max()}")
+
+    try:
+        # usebounds poda por eccentricidade e resolve com poucas BFS;
+        # se o diametro resolveu, o grafo e conexo — dispensa outra BFS
+        diametro = nx.diameter(topology, usebounds=True)
+        caminho_medio = nx.average_shortest_path_length(topology)
+        conexo = True
+        print(f"Diametro: {diametro}")
+        print(f"Caminho mais curto medio: {caminho_medio:.2f}")
+    except nx.NetworkXError:
+        conexo = False
+        print("Diametro: grafo desconexo")
+
+    print(f"Conexo: {conexo}")
+
+
+def print_disaster_phase_report(dataframe: pd.DataFrame, disaster_start: float, disaster_end: float) -> None:
+
+    # dataframe ordenado por tempo_criacao: dois searchsorted delimitam as
+    # tres fases de uma vez, sem tres comparacoes de coluna inteira
+    tempos = dataframe["tempo_criacao"].to_numpy()
+    bloqueadas = dataframe["bloqueada"].to_numpy()
+    i0, i1 = np.searchsorted(tempos, [disaster_start, disaster_end])
+
+    lines = []
+    for nome_fase, lo, hi in (("antes", 0, i0), ("durante", i0, i1), ("depois", i1, len(tempos))):
+        total = hi - lo
+        numero_bloqueadas = int(np.count_nonzero(bloqueadas[lo:hi]))
+        taxa = numero_bloqueadas / total if total else 0.0
+        lines.append(f"{nome_fase:<8} total: {total:>8}  bloqueadas: {numero_bloqueadas:>8}  disponibilidade: {1 - taxa:.4f}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_node_statistics(dataframe: pd.DataFrame, topology: 'nx.Graph', top_n: int = 5) -> None:
+
+    avail_by_node = metrics_calculator.availability_by_node_cached(dataframe)
+    degrees = dict(topology.degree())
+
+    nodes = list(avail_by_node.keys())
+    avails = np.fromiter(avail_by_node.values(), dtype=np.float64, count=len(nodes))
+    graus = np.fromiter((degrees.get(node, 0) for node in nodes), dtype=np.int32, count=len(nodes))
+
+    # argpartition seleciona os top_n piores sem ordenar a lista inteira
+    k = min(top_n, len(nodes))
+    piores = np.argpartition(avails, k - 1)[:k]
+    piores = piores[np.argsort(avails[piores])]
+
+    print(f"{'node':>6} {'disponibilidade':>16} {'grau':>6}")
+    for i in piores:
+        print(f"{nodes[i]:>6} {avails[i]:>16.4f} {graus[i]:>6}")
+
+
+def print_execution_time_report(duration: float) -> None:
+
+    horas, resto = divmod(int(duration), 3600)
+    minutos, segundos_inteiros = divmod(resto, 60)
+    segundos = segundos_inteiros + (duration - int(duration))
+    print(f"Tempo de execucao: {horas:02d}:{minutos:02d}:{segundos:06.3f}")
+
+
+def print_simulation_summary(dataframe: pd.DataFrame) -> None:
+
+    arr = dataframe["bloqueada"].to_numpy()
+    bloqueadas = int(np.count_nonzero(arr))
+    total = arr.size
+    taxa = bloqueadas / total if total else 0.0
+    print(f"Total de requisicoes: {total}")
+    print(f"Requisicoes bloqueadas: {bloqueadas}")
+    print(f"Taxa de bloqueio: {taxa:.4f}")
+    print(f"Disponibilidade: {1 - taxa:.4f}")
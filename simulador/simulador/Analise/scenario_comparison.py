@@ -0,0 +1,242 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from Cenario.Cenario import Cenario
+
+
+@dataclass(frozen=True, slots=True)
+class LoadedScenarios:
+    scenario1: Cenario
+    scenario2: Cenario
+    dataframe1: pd.DataFrame
+    dataframe2: pd.DataFrame
+    arrays1: dict[str, np.ndarray]
+    arrays2: dict[str, np.ndarray]
+    disaster_start: float
+    disaster_end: float
+    migration_times: dict[int, float]
+
+
+# unicas colunas tocadas pelas analises de comparacao; projetar na leitura
+# evita materializar o resto do frame
+NEEDED_COLS = ["src", "dst", "bloqueada", "tempo_criacao", "requisicao_de_migracao", "src_ISP_index", "dst_ISP_index"]
+_DTYPES = {
+    "src": "int32", "dst": "int32",
+    "bloqueada": "bool", "requisicao_de_migracao": "bool",
+    "src_ISP_index": "int32", "dst_ISP_index": "int32",
+    "tempo_criacao": "float64",
+}
+
+
+def _read_result_dataframe(caminho: str, columns: list[str] = NEEDED_COLS, filters: list = None) -> pd.DataFrame:
+    # prefere o parquet salvo pelo Registrador; para csv legado usa o
+    # parser paralelo do pyarrow em vez do tokenizador padrao
+    caminho_parquet = Path(caminho).with_suffix(".parquet")
+    if caminho_parquet.exists():
+        # predicados (ex. [("requisicao_de_migracao","==",True)]) descem ao
+        # arrow e evitam decodificar row groups que seriam descartados
+        return pd.read_parquet(caminho_parquet, columns=columns, filters=filters)
+    try:
+        dataframe = pd.read_csv(caminho, usecols=columns, dtype=_DTYPES, engine="pyarrow")
+    except (ImportError, ValueError):
+        dataframe = pd.read_csv(caminho, usecols=columns, dtype=_DTYPES)
+
+    try:
+        # cacheia em parquet na primeira leitura do csv; as proximas cargas
+        # pulam o parse de texto e a inferencia de tipos
+        dataframe.to_parquet(caminho_parquet)
+    except (ImportError, OSError):
+        pass
+    return dataframe
+
+
+def _como_arrays(dataframe: pd.DataFrame) -> dict[str, np.ndarray]:
+    # struct-of-arrays com as unicas colunas que as analises tocam;
+    # entregar os ndarrays prontos evita o dispatch do pandas e a
+    # re-extracao de coluna em cada metrica
+    return {nome: dataframe[nome].to_numpy()
+            for nome in ("tempo_criacao", "bloqueada", "requisicao_de_migracao",
+                         "src_ISP_index", "dst_ISP_index")}
+
+
+def _coluna(dados, nome: str) -> np.ndarray:
+    # aceita tanto o dict struct-of-arrays quanto um DataFrame legado
+    coluna = dados[nome]
+    return coluna if isinstance(coluna, np.ndarray) else coluna.to_numpy()
+
+
+def _pickle_load(caminho: str) -> Cenario:
+    # le o arquivo inteiro em uma syscall e desserializa do buffer em
+    # memoria, em vez das muitas leituras pequenas de pickle.load(f);
+    # os cenarios sao escritos com protocolo 5 (ver Cenario.salva_cenario)
+    with open(caminho, 'rb') as f:
+        return pickle.loads(f.read())
+
+
+def load_scenario_pair(scenario1_path: str, scenario2_path: str, df1_path: str, df2_path: str,
+                       filters: list = None) -> LoadedScenarios:
+
+    # as quatro leituras sao independentes e limitadas por I/O;
+    # sobrepostas em threads o tempo total vira o maximo, nao a soma
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futuro_cenario1 = executor.submit(_pickle_load, scenario1_path)
+        futuro_cenario2 = executor.submit(_pickle_load, scenario2_path)
+        futuro_df1 = executor.submit(_read_result_dataframe, df1_path, NEEDED_COLS, filters)
+        futuro_df2 = executor.submit(_read_result_dataframe, df2_path, NEEDED_COLS, filters)
+        scenario1 = futuro_cenario1.result()
+        scenario2 = futuro_cenario2.result()
+        dataframe1 = futuro_df1.result()
+        dataframe2 = futuro_df2.result()
+
+    desastre = scenario1.desastre
+    disaster_start = desastre.start
+    disaster_end = disaster_start + desastre.duration
+
+    migration_times = {isp.id: isp.datacenter.tempo_de_reacao
+                       for isp in scenario1.lista_de_ISPs if isp.datacenter is not None}
+
+    return LoadedScenarios(
+        scenario1=scenario1,
+        scenario2=scenario2,
+        dataframe1=dataframe1,
+        dataframe2=dataframe2,
+        arrays1=_como_arrays(dataframe1),
+        arrays2=_como_arrays(dataframe2),
+        disaster_start=disaster_start,
+        disaster_end=disaster_end,
+        migration_times=migration_times,
+    )
+
+
+_migration_idx_cache: dict[int, np.ndarray] = {}
+
+
+def _migration_indices(dataframe: pd.DataFrame) -> np.ndarray:
+    # o recorte de migracao e pedido varias vezes para o mesmo frame ao
+    # comparar cenarios; resolve a mascara para indices uma unica vez
+    chave = id(dataframe)
+    if chave not in _migration_idx_cache:
+        _migration_idx_cache[chave] = np.flatnonzero(dataframe["requisicao_de_migracao"].to_numpy())
+    return _migration_idx_cache[chave]
+
+
+def apply_filter(dataframe: pd.DataFrame, filter_type: str, isp_id: int = None) -> pd.DataFrame:
+    # devolve o recorte sem .copy(): os consumidores so leem o resultado.
+    # quando o dado vem de parquet, prefira empurrar o predicado para o
+    # load via load_scenario_pair(filters=...); isto aqui e o fallback
+    # em memoria para csv legado ou frames ja carregados
+
+    if filter_type == "No Filter":
+        return dataframe
+    # take por indices inteiros (flatnonzero + iloc) evita re-desempacotar
+    # a mascara booleana para cada coluna materializada
+    if filter_type == "Migration Traffic Only":
+        return dataframe.iloc[_migration_indices(dataframe)]
+    if filter_type == "By ISP":
+        # comparacao direta nos ndarrays int32, sem alinhamento de index
+        src = dataframe["src_ISP_index"].to_numpy()
+        dst = dataframe["dst_ISP_index"].to_numpy()
+        return dataframe.iloc[np.flatnonzero((src == isp_id) | (dst == isp_id))]
+    raise ValueError(f"Filtro desconhecido: {filter_type}")
+
+
+def _avail_and_block(bloqueadas: np.ndarray, lo: int, hi: int) -> tuple[float, float]:
+    # uma unica reducao da fatia serve as duas metricas: a taxa de
+    # bloqueio e a disponibilidade sao complementares
+    total = hi - lo
+    if not total:
+        return 0.0, 0.0
+    taxa = int(np.count_nonzero(bloqueadas[lo:hi])) / total
+    return 1 - taxa, taxa
+
+
+def create_comparison_data(dataframe1: pd.DataFrame, dataframe2: pd.DataFrame,
+                           migration_start: float, disaster_start: float, disaster_end: float) -> dict[str, dict[str, float]]:
+
+    dados = {}
+    for nome, dataframe in (("cenario1", dataframe1), ("cenario2", dataframe2)):
+        # com tempo_criacao ordenado cada fase vira uma fatia contigua:
+        # tres searchsorted O(log N) + reducoes em slices, sem mascaras
+        tempos = _coluna(dataframe, "tempo_criacao")
+        bloqueadas = _coluna(dataframe, "bloqueada")
+        if np.any(tempos[1:] < tempos[:-1]):
+            ordem = np.argsort(tempos)
+            tempos = tempos[ordem]
+            bloqueadas = bloqueadas[ordem]
+
+        i0, i1, i2 = np.searchsorted(tempos, [migration_start, disaster_start, disaster_end])
+        fases = {
+            "pre_migracao": (0, i0),
+            "migracao": (i0, i1),
+            "desastre": (i1, i2),
+            "pos_desastre": (i2, len(tempos)),
+        }
+        metricas = {}
+        for fase, (lo, hi) in fases.items():
+            disponibilidade, taxa = _avail_and_block(bloqueadas, lo, hi)
+            metricas[f"disponibilidade_{fase}"] = disponibilidade
+            metricas[f"taxa_bloqueio_{fase}"] = taxa
+        dados[nome] = metricas
+    return dados
+
+
+def create_multi_scenario_comparison_data(dataframes: dict[str, pd.DataFrame],
+                                          disaster_start: float, disaster_end: float) -> dict[str, dict[str, float]]:
+
+    dados = {}
+    for nome, dataframe in dataframes.items():
+        tempos = _coluna(dataframe, "tempo_criacao")
+        bloqueadas = _coluna(dataframe, "bloqueada")
+        migracao = _coluna(dataframe, "requisicao_de_migracao")
+
+        # uma unica passada por cenario: fase (0=antes, 1=durante, 2=depois)
+        # combinada com o flag de migracao vira um indice 0..5 para dois
+        # bincounts, no lugar de seis sub-frames mascarados
+        fase = np.digitize(tempos, [disaster_start, disaster_end])
+        indices = fase * 2 + migracao
+        totais = np.bincount(indices, minlength=6)
+        # contagem inteira apenas das linhas bloqueadas, em vez do caminho
+        # de pesos float do bincount sobre a coluna inteira
+        numero_bloqueadas = np.bincount(indices[bloqueadas], minlength=6)
+
+        metricas = {}
+        for idx_fase, nome_fase in enumerate(("antes", "durante", "depois")):
+            total = int(totais[idx_fase * 2] + totais[idx_fase * 2 + 1])
+            bloqueio = numero_bloqueadas[idx_fase * 2] + numero_bloqueadas[idx_fase * 2 + 1]
+            metricas[f"taxa_bloqueio_{nome_fase}"] = bloqueio / total if total else 0.0
+
+            total_migracao = int(totais[idx_fase * 2 + 1])
+            bloqueio_migracao = numero_bloqueadas[idx_fase * 2 + 1]
+            metricas[f"taxa_bloqueio_migracao_{nome_fase}"] = bloqueio_migracao / total_migracao if total_migracao else 0.0
+        dados[nome] = metricas
+    return dados
+
+
+def calculate_blocking_probability_over_time(dataframe: pd.DataFrame, bucket_size: float = 10.0) -> tuple[np.ndarray, np.ndarray]:
+
+    tempos = _coluna(dataframe, "tempo_criacao")
+    # cumsum soma bools direto para int64; a copia via astype e desnecessaria
+    bloqueadas = _coluna(dataframe, "bloqueada")
+
+    if np.any(tempos[1:] < tempos[:-1]):
+        ordem = np.argsort(tempos)
+        tempos = tempos[ordem]
+        bloqueadas = bloqueadas[ordem]
+
+    # buckets de largura constante: prefix-sum de bloqueadas + searchsorted
+    # das bordas da O(1) por bucket, sem groupby nem mascara por bin
+    bins = np.arange(tempos[0], tempos[-1] + bucket_size, bucket_size)
+    bordas = np.searchsorted(tempos, bins)
+    acumulado = np.concatenate(([0], np.cumsum(bloqueadas)))
+    bloqueadas_por_bucket = np.diff(acumulado[bordas])
+    totais = np.diff(bordas)
+
+    com_requisicoes = totais > 0
+    taxas = bloqueadas_por_bucket[com_requisicoes] / totais[com_requisicoes]
+    centros = ((bins[:-1] + bins[1:]) / 2)[com_requisicoes]
+    return centros, taxas
@@ -0,0 +1,207 @@
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+from networkx.algorithms.flow import shortest_augmenting_path
+
+from Analise._kernels import NUMBA_DISPONIVEL, max_flow_min_cut
+
+
+def remove_node_from_graph(graph: nx.Graph, nodes: list[int]) -> nx.Graph:
+    # view somente leitura sem copiar o grafo: a analise so le a adjacencia,
+    # e copiar O(E) por node dominava o tempo fora do max-flow
+    return nx.restricted_view(graph, nodes, [])
+
+
+def _garante_capacidades(graph: nx.Graph) -> None:
+    # os dicts de atributo sao compartilhados entre o grafo e suas views;
+    # feito uma vez no grafo pai vale para todos os subgrafos
+    for u, v in graph.edges():
+        if "capacity" not in graph[u][v]:
+            graph[u][v]["capacity"] = 1
+
+
+def _to_csr(graph: nx.Graph) -> tuple[list, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # adjacencia CSR (indptr/indices) com capacidades e indice do arco
+    # reverso, construida em uma passada pelas arestas
+    nodes = list(graph.nodes())
+    node_to_idx = {node: idx for idx, node in enumerate(nodes)}
+
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    for u, v in graph.edges():
+        indptr[node_to_idx[u] + 1] += 1
+        indptr[node_to_idx[v] + 1] += 1
+    np.cumsum(indptr, out=indptr)
+
+    numero_de_arcos = int(indptr[-1])
+    indices = np.empty(numero_de_arcos, dtype=np.int64)
+    rev = np.empty(numero_de_arcos, dtype=np.int64)
+    cap = np.empty(numero_de_arcos, dtype=np.int64)
+    cursor = indptr[:-1].copy()
+    for u, v, atributos in graph.edges(data=True):
+        iu, iv = node_to_idx[u], node_to_idx[v]
+        arco_ida, arco_volta = cursor[iu], cursor[iv]
+        indices[arco_ida] = iv
+        indices[arco_volta] = iu
+        rev[arco_ida] = arco_volta
+        rev[arco_volta] = arco_ida
+        cap[arco_ida] = cap[arco_volta] = atributos.get("capacity", 1)
+        cursor[iu] += 1
+        cursor[iv] += 1
+    return nodes, indptr, indices, rev, cap
+
+
+def _componente_de_cada_node(graph: nx.Graph) -> dict:
+    # um unico BFS por componente substitui o has_path por par (s, t),
+    # que escondia uma varredura completa do grafo dentro do loop O(N^2)
+    comp_of = {}
+    for idx, componente in enumerate(nx.connected_components(graph)):
+        for node in componente:
+            comp_of[node] = idx
+    return comp_of
+
+
+def _find_balanced_min_cut_csr(graph: nx.Graph) -> dict:
+    nodes, indptr, indices, rev, cap = _to_csr(graph)
+    numero_de_nodes = len(nodes)
+    comp_of = _componente_de_cada_node(graph)
+    componente = np.fromiter((comp_of[node] for node in nodes), dtype=np.int64, count=numero_de_nodes)
+
+    best_cut_value = None
+    best_size_difference = None
+    best_partition = None
+    particoes_vistas = set()
+
+    for s in range(numero_de_nodes):
+        for t in range(s + 1, numero_de_nodes):
+            if componente[s] != componente[t]:
+                continue
+            cut_value, alcancavel = max_flow_min_cut(indptr, indices, rev, cap, s, t)
+
+            reachable = {nodes[idx] for idx in np.flatnonzero(alcancavel)}
+            non_reachable = {nodes[idx] for idx in np.flatnonzero(~alcancavel)}
+            # chave canonica: tupla ordenada do lado menor — um hash barato
+            # no lugar de dois frozensets por iteracao
+            menor_lado = reachable if len(reachable) <= len(non_reachable) else non_reachable
+            chave = tuple(sorted(menor_lado))
+            if chave in particoes_vistas:
+                continue
+            particoes_vistas.add(chave)
+
+            size_difference = abs(len(reachable) - len(non_reachable))
+            if best_cut_value is None or (cut_value, size_difference) < (best_cut_value, best_size_difference):
+                best_cut_value = int(cut_value)
+                best_size_difference = size_difference
+                best_partition = (reachable, non_reachable)
+                if best_cut_value == 1 and best_size_difference <= 1:
+                    break
+        else:
+            continue
+        break
+
+    return {
+        "cut_value": best_cut_value,
+        "size_difference": best_size_difference,
+        "partition": best_partition,
+    }
+
+
+def find_balanced_min_cut(graph: nx.Graph) -> dict:
+    # procura o corte minimo que melhor equilibra os dois lados da rede;
+    # usado para avaliar em quais pontos um desastre separa a topologia
+
+    _garante_capacidades(graph)
+
+    if NUMBA_DISPONIVEL:
+        # kernel Edmonds-Karp compilado sobre arrays CSR: remove o dispatch
+        # Python do networkx do caminho O(N^2) de max-flows
+        return _find_balanced_min_cut_csr(graph)
+
+    nodes = list(graph.nodes())
+    best_cut_value = None
+    best_size_difference = None
+    best_partition = None
+    particoes_vistas = set()
+
+    comp_of = _componente_de_cada_node(graph)
+
+    # grafo nao direcionado: minimum_cut(G, s, t) == minimum_cut(G, t, s),
+    # entao basta percorrer os pares com s < t — metade dos max-flows
+    for i, s in enumerate(nodes):
+        for t in nodes[i + 1:]:
+            if comp_of[s] != comp_of[t]:
+                continue
+
+            # em grafos esparsos com capacidade unitaria o augmenting path
+            # mais curto bate o preflow_push padrao por um fator constante
+            cut_value, (reachable, non_reachable) = nx.minimum_cut(
+                graph, s, t, flow_func=shortest_augmenting_path)
+
+            # chave canonica: tupla ordenada do lado menor — um hash barato
+            # no lugar de dois frozensets por iteracao
+            menor_lado = reachable if len(reachable) <= len(non_reachable) else non_reachable
+            chave = tuple(sorted(menor_lado))
+            if chave in particoes_vistas:
+                continue
+            particoes_vistas.add(chave)
+
+            size_difference = abs(len(reachable) - len(non_reachable))
+            if best_cut_value is None or (cut_value, size_difference) < (best_cut_value, best_size_difference):
+                best_cut_value = cut_value
+                best_size_difference = size_difference
+                best_partition = (set(reachable), set(non_reachable))
+                # corte unitario com lados equilibrados e o otimo absoluto:
+                # nenhum par (s, t) restante pode melhorar, abandona a busca
+                if best_cut_value == 1 and best_size_difference <= 1:
+                    break
+        else:
+            continue
+        break
+
+    return {
+        "cut_value": best_cut_value,
+        "size_difference": best_size_difference,
+        "partition": best_partition,
+    }
+
+
+def _analisa_node(argumentos: tuple[nx.Graph, int]) -> tuple[int, dict]:
+    topology, node = argumentos
+    return node, find_balanced_min_cut(remove_node_from_graph(topology, [node]))
+
+
+def find_balanced_min_cut_for_all_nodes(topology: nx.Graph, cache_dir: str = ".cache") -> dict[int, dict]:
+
+    # a analise e deterministica e cara (O(N^2) max-flows por node);
+    # cacheia em disco chaveado pelo conteudo da lista de arestas
+    chave = hashlib.blake2b(repr(sorted(topology.edges(data=True))).encode()).hexdigest()
+    caminho_cache = Path(cache_dir) / f"mincut_{chave}.pkl"
+    if caminho_cache.exists():
+        return pickle.loads(caminho_cache.read_bytes())
+
+    _garante_capacidades(topology)
+
+    # so a remocao de um ponto de articulacao (ou de um vizinho imediato)
+    # pode gerar cortes pequenos e equilibrados; um unico DFS os encontra
+    # e restringe a busca cara de max-flow a essa fracao dos nodes
+    articulacoes = set(nx.articulation_points(topology))
+    if articulacoes:
+        candidatos = set(articulacoes)
+        for node in articulacoes:
+            candidatos.update(topology.neighbors(node))
+    else:
+        candidatos = set(topology.nodes())
+
+    # cada node e uma analise independente: espalha os max-flows pelos
+    # cores em processos, como em experiment_runner
+    nodes_analisados = [node for node in topology.nodes() if node in candidatos]
+    with ProcessPoolExecutor() as executor:
+        dados = dict(executor.map(_analisa_node, zip(repeat(topology), nodes_analisados)))
+
+    caminho_cache.parent.mkdir(parents=True, exist_ok=True)
+    caminho_cache.write_bytes(pickle.dumps(dados, protocol=pickle.HIGHEST_PROTOCOL))
+    return dados
@@ -34,7 +34,7 @@ class Cenario:
     
     def salva_cenario(self, nome: str ) -> None:
         with open(f'.cenario/cenarios/{nome}.pkl', 'wb') as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
     
     @staticmethod
     def carrega_cenario(caminho: str) -> 'Cenario':
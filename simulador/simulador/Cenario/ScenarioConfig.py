@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+from Variaveis import BANDWIDTH, CLASS_TYPE, CLASS_WEIGHT
+
+try:
+    # orjson serializa em C e libera a GIL; json da stdlib segue como fallback
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
+
+
+@dataclass(frozen=True)
+class ScenarioConfig:
+    # equivalente imutavel dos parametros de Variaveis, para varreduras com
+    # varias configuracoes convivendo no mesmo processo
+
+    # tuplas imutaveis compartilhadas como default direto: nenhuma copia
+    # de lista por instancia ao gerar milhares de configs numa varredura
+    bandwidth_options: tuple[int, ...] = BANDWIDTH
+    class_types: tuple[float, ...] = CLASS_TYPE
+    class_weights: tuple[float, ...] = CLASS_WEIGHT
+
+    holding_time: float = 1.0
+
+    numero_de_slots: int = 200
+    numero_de_caminhos: int = 10
+    slot_size: float = 12.5
+    numero_de_edges: int = 43
+
+    erlangs: float = 110.0
+    numero_de_requisicoes: int = 100000
+    numero_de_isps: int = 5
+
+    inicio_desastre: float = 600.0
+    duracao_desastre: float = 200.0
+    tempo_de_reacao: float = 300.0
+
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        # derivados congelados na construcao (um passo alem do cache por
+        # acesso): ler avg_bandwidth e um load direto do __dict__, sem
+        # chamada de descriptor dentro dos loops internos da simulacao
+        object.__setattr__(self, "avg_bandwidth", sum(self.bandwidth_options) / len(self.bandwidth_options))
+        object.__setattr__(self, "avg_slots_per_request", self.avg_bandwidth / self.slot_size)
+        object.__setattr__(self, "network_capacity", self.numero_de_slots * self.numero_de_edges)
+        object.__setattr__(self, "requisicoes_por_segundo", self.erlangs / self.holding_time)
+        object.__setattr__(self, "throughput", self.network_capacity * 0.025)
+        object.__setattr__(self, "tamanho_datacenter", self.throughput * self.tempo_de_reacao * 0.75)
+        object.__setattr__(self, "tempo_disponivel_para_migracao", self.inicio_desastre - self.tempo_de_reacao)
+
+    def __hash__(self) -> int:
+        # o __hash__ gerado pelo dataclass percorre todos os campos a cada
+        # chamada; varreduras usam configs como chave de dict e re-hasheiam
+        # a mesma instancia muitas vezes, entao o valor fica cacheado
+        try:
+            return self.__dict__["_hash_cache"]
+        except KeyError:
+            valor = hash(tuple(getattr(self, nome) for nome in self.__dataclass_fields__))
+            object.__setattr__(self, "_hash_cache", valor)
+            return valor
+
+    def to_dict(self) -> dict:
+        # comprehension rasa no lugar do deep-copy recursivo de asdict: os
+        # campos ja sao escalares ou tuplas imutaveis. o dict e cacheado e
+        # compartilhado entre chamadas — trate o resultado como somente leitura
+        try:
+            return self.__dict__["_dict_cache"]
+        except KeyError:
+            valor = {f.name: getattr(self, f.name) for f in fields(self)}
+            object.__setattr__(self, "_dict_cache", valor)
+            return valor
+
+    @classmethod
+    def from_dict(cls, dados: dict) -> 'ScenarioConfig':
+        # json devolve listas; os campos de sequencia precisam voltar a
+        # tuplas para a config continuar hashavel e compartilhavel
+        dados = {nome: (tuple(valor) if isinstance(valor, list) else valor)
+                 for nome, valor in dados.items()}
+        return cls(**dados)
+
+    def diff(self, other: 'ScenarioConfig') -> dict:
+        # um to_dict por lado e uma comparacao de dicts, em vez de dois
+        # getattr por campo
+        meus_valores = self.to_dict()
+        outros_valores = other.to_dict()
+        return {nome: (meus_valores[nome], outros_valores[nome])
+                for nome in meus_valores if meus_valores[nome] != outros_valores[nome]}
+
+    def fingerprint(self) -> str:
+        # a config descreve o cenario por completo (a aleatoriedade e
+        # fixada pelo campo seed), entao o hash do conteudo serve de
+        # endereco para o cache em disco
+        return hashlib.blake2b(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()[:16]
+
+    def load_or_generate(self, generator_fn, cache_dir: str = ".scenario_cache"):
+        # curto-circuita a geracao de cenario: configs identicas viram um
+        # load de pickle em vez de regenerar trafego e caminhos
+        caminho_cache = Path(cache_dir) / f"{self.fingerprint()}.pkl"
+        if caminho_cache.exists():
+            return pickle.loads(caminho_cache.read_bytes())
+
+        resultado = generator_fn(self)
+
+        caminho_cache.parent.mkdir(parents=True, exist_ok=True)
+        # escrita atomica: serializa em temporario e troca com os.replace,
+        # para outro processo nunca ler um pickle pela metade
+        descritor, caminho_temporario = tempfile.mkstemp(dir=caminho_cache.parent, suffix=".tmp")
+        with os.fdopen(descritor, 'wb') as f:
+            pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(caminho_temporario, caminho_cache)
+        return resultado
+
+    def save_to_json(self, caminho: str) -> None:
+        if ORJSON_DISPONIVEL:
+            Path(caminho).write_bytes(
+                orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+            return
+        with open(caminho, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load_from_json(cls, caminho: str) -> 'ScenarioConfig':
+        if ORJSON_DISPONIVEL:
+            return cls.from_dict(orjson.loads(Path(caminho).read_bytes()))
+        with open(caminho) as f:
+            return cls.from_dict(json.load(f))
+
+
+def sweep_to_dataframe(configs: list[ScenarioConfig]) -> 'pd.DataFrame':
+    # uma linha por config: as agregacoes da varredura rodam vetorizadas
+    # no pandas em vez de loops Python por config
+    import pandas as pd
+    return pd.DataFrame.from_records([config.to_dict() for config in configs])
+
+
+def sweep_diff(dataframe) -> list[str]:
+    # colunas cujo valor varia dentro da varredura
+    return [coluna for coluna in dataframe.columns if dataframe[coluna].nunique(dropna=False) > 1]
+
+
+def diff_many(configs: list[ScenarioConfig], baseline: ScenarioConfig) -> list[dict]:
+    # diff de N configs contra uma base em O(N * campos), com um unico
+    # to_dict por config, em vez do O(N^2) de diffs par a par
+    valores_base = baseline.to_dict()
+    diferencas = []
+    for config in configs:
+        valores = config.to_dict()
+        diferencas.append({nome: (valores_base[nome], valores[nome])
+                           for nome in valores_base if valores_base[nome] != valores[nome]})
+    return diferencas
+
+
+def save_many(configs: list[ScenarioConfig], dirpath: str) -> None:
+    # orjson libera a GIL durante o dumps, entao as escritas de uma
+    # varredura grande sobrepoem bem em threads
+    from concurrent.futures import ThreadPoolExecutor
+
+    destino = Path(dirpath)
+    destino.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor() as executor:
+        for config in configs:
+            executor.submit(config.save_to_json, str(destino / f"{config.fingerprint()}.json"))
+
+
+# todos os presets derivam da mesma baseline com dataclasses.replace:
+# os campos nao sobrescritos (tuplas de banda/classe inclusive) sao os
+# mesmos objetos compartilhados, sem realocacao por preset
+_BASELINE = ScenarioConfig()
+
+PRESET_SCENARIO_CONFIGS: dict[str, ScenarioConfig] = {
+    "baseline": _BASELINE,
+    "alta_carga": replace(_BASELINE, erlangs=150.0),
+    "baixa_carga": replace(_BASELINE, erlangs=70.0),
+    "desastre_longo": replace(_BASELINE, duracao_desastre=400.0),
+    "reacao_lenta": replace(_BASELINE, tempo_de_reacao=450.0),
+}
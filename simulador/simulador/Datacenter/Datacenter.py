@@ -1,4 +1,5 @@
 
+from collections import deque
 from Variaveis import *
 from numpy.random import choice
 from random import expovariate
@@ -23,7 +24,7 @@ class Datacenter:
         self.tempo_de_reacao: float = tempo_de_reacao
         self.tamanho_datacenter: float = tamanho_datacenter
         self.throughput_por_segundo: float = throughput_por_segundo
-        self.lista_de_requisicoes: list[Requisicao] = None
+        self.lista_de_requisicoes: deque[Requisicao] = None
 
     def iniciar_migracao(self, simulador: 'Simulador', isp: 'ISP') -> None:
         simulador.env.process( self.__migrar(simulador, isp) )
@@ -67,7 +68,8 @@ class Datacenter:
     def pega_requisicao(self, id:int, topologia: 'Topologia', isp_id: int) -> Requisicao:
          
          if self.lista_de_requisicoes:
-            return self.lista_de_requisicoes.pop(0)
+            # popleft e O(1); pop(0) numa lista grande de migracao era O(n)
+            return self.lista_de_requisicoes.popleft()
          else:
             return self.gerar_requisicao(id, topologia, isp_id)
          
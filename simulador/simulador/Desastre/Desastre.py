@@ -1,5 +1,6 @@
 import simpy
 import networkx as nx
+from collections import deque
 from ISP.ISP import ISP
 from Requisicao.Requisicao import Requisicao
 from Roteamento.iRoteamento import iRoteamento
@@ -14,7 +15,9 @@ class Desastre:
     def __init__(self, start, duration, list_of_dict_node_per_start_time, list_of_dict_link_per_start_time, eventos) -> None:
         self.start = start
         self.duration = duration
-        self.eventos_nao_iniciados: list[dict] = eventos
+        # deque: o consumo em __gerar_falhas retira sempre da frente, e
+        # popleft e O(1) contra o O(n) de list.pop(0)
+        self.eventos_nao_iniciados: deque[dict] = deque(eventos)
         self.list_of_dict_node_per_start_time = list_of_dict_node_per_start_time
         self.list_of_dict_link_per_start_time = list_of_dict_link_per_start_time
         
@@ -31,22 +34,23 @@ class Desastre:
             simulador.env.process(isp.iniciar_migracao(simulador))
 
     def seta_links_como_prestes_a_falhar(self, simulador:'Simulador') -> None:
+        topology = simulador.topology
         for dict_link in self.list_of_dict_link_per_start_time:
             src = dict_link['src']
             dst = dict_link['dst']
-            simulador.topology.topology[src][dst]['vai falhar'] = True
-        
+            topology.vai_falhar[topology.edge_index[(src, dst)]] = True
+
         for dict_node in self.list_of_dict_node_per_start_time:
             node = dict_node['node']
-            for neighbor in simulador.topology.topology.neighbors(node):
-                simulador.topology.topology[node][neighbor]['vai falhar'] = True
+            for neighbor in topology.topology.neighbors(node):
+                topology.vai_falhar[topology.edge_index[(node, neighbor)]] = True
 
     def __gerar_falhas(self, simulador:'Simulador') -> Generator:
 
-        while self.eventos_nao_iniciados != []:
-            tempo_pro_proximo_evento = ( self.eventos_nao_iniciados[0]['start_time'] + self.start) - simulador.env.now 
+        while self.eventos_nao_iniciados:
+            tempo_pro_proximo_evento = ( self.eventos_nao_iniciados[0]['start_time'] + self.start) - simulador.env.now
             yield simulador.env.timeout( tempo_pro_proximo_evento )
-            evento = self.eventos_nao_iniciados.pop(0)
+            evento = self.eventos_nao_iniciados.popleft()
             self.__ativa_evento(evento, simulador)
             simulador.env.process(self.__desativa_evento(evento, simulador))
             
@@ -76,11 +80,11 @@ class Desastre:
             Logger.mensagem_acompanha_link_desastre(informacoes_evento['src'], informacoes_evento['dst'], simulador.env.now)
             
     def __restaura_link(self, informacoes_evento: dict, simulador: 'Simulador') -> None:
-        src = informacoes_evento['src']
-        dst = informacoes_evento['dst']
-        if simulador.topology.topology.has_edge(src, dst) and simulador.topology.topology[src][dst]['failed']:
-            simulador.topology.topology[src][dst]['failed'] = False
-            simulador.topology.topology[src][dst]['vai falhar'] = False
+        topology = simulador.topology
+        edge_id = topology.edge_index.get((informacoes_evento['src'], informacoes_evento['dst']))
+        if edge_id is not None and topology.failed[edge_id]:
+            topology.failed[edge_id] = False
+            topology.vai_falhar[edge_id] = False
     
     def __restaura_no(self, informacoes_evento, simulador: 'Simulador') -> None:
         node = informacoes_evento['node']
@@ -90,27 +94,33 @@ class Desastre:
 
     def __FalhaNoLink(self, node1, node2, simulador:'Simulador') -> None:
         topology = simulador.topology
-        if topology.topology.has_edge(node1, node2) and not topology.topology[node1][node2]['failed']:
-            
-            topology.topology[node1][node2]['failed'] = True
-            
+        edge_id = topology.edge_index.get((node1, node2))
+        if edge_id is not None and not topology.failed[edge_id]:
+
+            topology.failed[edge_id] = True
+
 
             requisicoes_falhas :list[Requisicao] = self.__Quem_falhou_link(node1, node2, simulador)
 
-            
-            for requisicao in requisicoes_falhas:
-                if requisicao.afetada_por_desastre == False:
-                    Registrador.conta_reroteadas_por_banda(requisicao.bandwidth)
-                    Registrador.conta_reroteadas_por_classe(requisicao.class_type)
-                    Registrador.adiciona_numero_de_afetadas(1)
-
-                    requisicao.processo_de_desalocacao.interrupt()
-                    index_isp = requisicao.src_ISP_index
-                    topology.desalocate(requisicao.caminho, requisicao.index_de_inicio_e_final)
-                    requisicao.afetada_por_desastre = True
-                    roteador: iRoteamento = simulador.lista_de_ISPs[index_isp].roteamento_atual
-                    roteador.rerotear_requisicao(requisicao, topology, simulador.env)
-                    requisicao.afetada_por_desastre = True
+            afetadas = [requisicao for requisicao in requisicoes_falhas
+                        if requisicao.afetada_por_desastre == False]
+            if not afetadas:
+                return
+
+            # fase de lote: contabiliza e desaloca todas as afetadas antes de
+            # rerotear, que e a unica etapa inerentemente por requisicao
+            Registrador.conta_reroteadas_em_lote([requisicao.bandwidth for requisicao in afetadas],
+                                                 [requisicao.class_type for requisicao in afetadas])
+            Registrador.adiciona_numero_de_afetadas(len(afetadas))
+
+            for requisicao in afetadas:
+                requisicao.processo_de_desalocacao.interrupt()
+                topology.desalocate(requisicao.caminho, requisicao.index_de_inicio_e_final, requisicao.edge_ids, requisicao)
+                requisicao.afetada_por_desastre = True
+
+            for requisicao in afetadas:
+                roteador: iRoteamento = simulador.lista_de_ISPs[requisicao.src_ISP_index].roteamento_atual
+                roteador.rerotear_requisicao(requisicao, topology, simulador.env)
 
     def __FalhaNoNo(self, node, simulador:'Simulador') -> None:
         topology = simulador.topology.topology
@@ -121,15 +131,19 @@ class Desastre:
                self.__FalhaNoLink(node, neighbor, simulador)
 
     def __Quem_falhou_link(self, pontaa, pontab, simulador:'Simulador') -> list[Requisicao] :
+        # consulta o indice reverso do link em vez de varrer todas as
+        # requisicoes ja criadas: so quem esta alocado no link aparece aqui
         requisicoes_ativas_que_falharam_no_link:list[Requisicao] = []
-        requisicoes = Registrador.get_requisicoes()
+        edge_id = simulador.topology.edge_index.get((pontaa, pontab))
+        if edge_id is None:
+            return requisicoes_ativas_que_falharam_no_link
 
-        for req in requisicoes:
-            if (req.bloqueada == False and simulador.topology.caminho_passa_por_link(pontaa, pontab, req.caminho) and
+        for req in simulador.topology.requisicoes_ativas_por_edge[edge_id]:
+            if (req.bloqueada == False and
                  simulador.env.now >= req.tempo_criacao and simulador.env.now < req.tempo_desalocacao):
-                
+
                 req.dados_pre_reroteamento = req.retorna_tupla_chave_dicionario_dos_atributos()[1]
                 requisicoes_ativas_que_falharam_no_link.append(req)
-            
+
         return requisicoes_ativas_que_falharam_no_link
 
@@ -1,23 +1,50 @@
-from Requisicao.Requisicao import Requisicao
+from Requisicao.Requisicao import Requisicao, RequisicaoSnapshot
+import numpy as np
 import pandas as pd
 import json
 
+_BANDAS = (100, 150, 200, 250, 300, 350, 400)
+_CLASSES = (1, 2, 3)
+
+def _indice_banda(banda: int) -> int:
+    # BANDWIDTH e uma progressao aritmetica (100, 150, ..., 400); o indice
+    # sai por aritmetica pura, sem hash nem cadeia de comparacoes. Se a
+    # progressao mudar em Variaveis, volte a um dict {banda: indice}
+    return (banda - 100) // 50
+
+
 class Registrador:
 
     instance: 'Registrador' = None
-    
+
+    # sem __dict__ por instancia: atributos viram slots em C, menores e
+    # mais rapidos de acessar no caminho quente dos contadores
+    __slots__ = (
+        "_requisicoes_por_classe", "_requisicoes_bloqueadas_por_classe",
+        "_requisicoes_por_banda", "_requisicoes_bloqueadas_por_banda",
+        "_reroteadas_por_classe", "_reroteadas_bloqueadas_por_classe",
+        "_reroteadas_por_banda", "_reroteadas_bloqueadas_por_banda",
+        "numero_requisicoes_afetadas_desastre",
+        "numero_requisicoes", "numero_requisicoes_bloqueadas",
+        "numero_requisicoes_reroteadas", "numero_requisicoes_reroteadas_bloqueadas",
+        "requisicoes", "migracao_concluida",
+    )
+
     def __init__(self) -> None:
-        self.numero_requisicoes_por_classe: dict[int, int] = {1:0, 2:0, 3:0}
-        self.numero_requisicoes_bloqueadas_por_classe: dict[int, int] = {1:0, 2:0, 3:0}
-        self.numero_requisicoes_por_banda: dict[int, int] = { 100:0, 150:0, 200:0, 250:0, 300:0, 350:0, 400:0}
-        self.numero_requisicoes_bloqueadas_por_banda: dict[int, int] = { 100:0, 150:0, 200:0, 250:0, 300:0, 350:0, 400:0}
+        # contadores em arrays numpy indexados por banda/classe: cada conta_*
+        # vira um incremento indexado em vez de um update de dict por chave,
+        # e os totais por categoria saem vetorizados no fim da simulacao
+        self._requisicoes_por_classe = np.zeros(len(_CLASSES), dtype=np.int64)
+        self._requisicoes_bloqueadas_por_classe = np.zeros(len(_CLASSES), dtype=np.int64)
+        self._requisicoes_por_banda = np.zeros(len(_BANDAS), dtype=np.int64)
+        self._requisicoes_bloqueadas_por_banda = np.zeros(len(_BANDAS), dtype=np.int64)
 
         self.numero_requisicoes_afetadas_desastre: int = 0
 
-        self.numero_reroteadas_por_classe: dict[int, int] = {1:0, 2:0, 3:0}
-        self.numero_reroteadas_bloqueadas_por_classe: dict[int, int] = {1:0, 2:0, 3:0}
-        self.numero_reroteadas_por_banda: dict[int, int] = { 100:0, 150:0, 200:0, 250:0, 300:0, 350:0, 400:0}
-        self.numero_reroteadas_bloqueadas_por_banda: dict[int, int] = { 100:0, 150:0, 200:0, 250:0, 300:0, 350:0, 400:0}
+        self._reroteadas_por_classe = np.zeros(len(_CLASSES), dtype=np.int64)
+        self._reroteadas_bloqueadas_por_classe = np.zeros(len(_CLASSES), dtype=np.int64)
+        self._reroteadas_por_banda = np.zeros(len(_BANDAS), dtype=np.int64)
+        self._reroteadas_bloqueadas_por_banda = np.zeros(len(_BANDAS), dtype=np.int64)
 
         self.numero_requisicoes: int = 0
         self.numero_requisicoes_bloqueadas: int = 0
@@ -27,9 +54,45 @@ class Registrador:
     
         self.migracao_concluida: dict[tuple[float, float]] = {}
 
+    # visoes em dict com as chaves antigas, montadas sob demanda a partir
+    # dos arrays; os consumidores de relatorio continuam vendo dicts
+    @property
+    def numero_requisicoes_por_classe(self) -> dict[int, int]:
+        return dict(zip(_CLASSES, self._requisicoes_por_classe.tolist()))
+
+    @property
+    def numero_requisicoes_bloqueadas_por_classe(self) -> dict[int, int]:
+        return dict(zip(_CLASSES, self._requisicoes_bloqueadas_por_classe.tolist()))
+
+    @property
+    def numero_requisicoes_por_banda(self) -> dict[int, int]:
+        return dict(zip(_BANDAS, self._requisicoes_por_banda.tolist()))
+
+    @property
+    def numero_requisicoes_bloqueadas_por_banda(self) -> dict[int, int]:
+        return dict(zip(_BANDAS, self._requisicoes_bloqueadas_por_banda.tolist()))
+
+    @property
+    def numero_reroteadas_por_classe(self) -> dict[int, int]:
+        return dict(zip(_CLASSES, self._reroteadas_por_classe.tolist()))
+
+    @property
+    def numero_reroteadas_bloqueadas_por_classe(self) -> dict[int, int]:
+        return dict(zip(_CLASSES, self._reroteadas_bloqueadas_por_classe.tolist()))
+
+    @property
+    def numero_reroteadas_por_banda(self) -> dict[int, int]:
+        return dict(zip(_BANDAS, self._reroteadas_por_banda.tolist()))
+
+    @property
+    def numero_reroteadas_bloqueadas_por_banda(self) -> dict[int, int]:
+        return dict(zip(_BANDAS, self._reroteadas_bloqueadas_por_banda.tolist()))
+
     @staticmethod
     def get_intance() -> 'Registrador':
-        if Registrador.instance == None:
+        # is None: comparacao de identidade em C, sem protocolo __eq__;
+        # este teste roda uma vez por contador em cada evento
+        if Registrador.instance is None:
             Registrador.instance = Registrador()
         return Registrador.instance
     
@@ -62,44 +125,54 @@ class Registrador:
     def conta_requisicao_banda(banda: int ) -> None:
 
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_requisicoes_por_banda[banda] += 1
+        registrador._requisicoes_por_banda[_indice_banda(banda)] += 1
 
     @staticmethod
     def conta_requisicao_classe(classe: int ) -> None:
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_requisicoes_por_classe[classe] += 1
+        registrador._requisicoes_por_classe[classe - 1] += 1
 
     @staticmethod
     def conta_bloqueio_requisicao_banda( banda: int ) -> None:
 
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_requisicoes_bloqueadas_por_banda[banda] += 1
+        registrador._requisicoes_bloqueadas_por_banda[_indice_banda(banda)] += 1
 
     @staticmethod
     def conta_bloqueio_requisicao_classe( classe: int ) -> None:
 
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_requisicoes_bloqueadas_por_classe[classe] += 1
+        registrador._requisicoes_bloqueadas_por_classe[classe - 1] += 1
+
+    @staticmethod
+    def conta_reroteadas_em_lote(bandas: list[int], classes: list[int]) -> None:
+        # uma onda de falha de link afeta dezenas de requisicoes de uma vez;
+        # dois bincount substituem um par de chamadas por requisicao
+        registrador: Registrador = Registrador.get_intance()
+        indices_banda = np.fromiter((_indice_banda(banda) for banda in bandas), np.int64, count=len(bandas))
+        indices_classe = np.fromiter((classe - 1 for classe in classes), np.int64, count=len(classes))
+        registrador._reroteadas_por_banda += np.bincount(indices_banda, minlength=len(_BANDAS))
+        registrador._reroteadas_por_classe += np.bincount(indices_classe, minlength=len(_CLASSES))
 
     @staticmethod
     def conta_reroteadas_por_classe(classe: int ) -> None:
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_reroteadas_por_classe[classe] += 1
+        registrador._reroteadas_por_classe[classe - 1] += 1
     
     @staticmethod
     def conta_reroteadas_por_banda(banda: int ) -> None:
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_reroteadas_por_banda[banda] += 1
+        registrador._reroteadas_por_banda[_indice_banda(banda)] += 1
     
     @staticmethod
     def conta_bloqueio_reroteadas_por_classe(classe: int ) -> None:
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_reroteadas_bloqueadas_por_classe[classe] += 1
+        registrador._reroteadas_bloqueadas_por_classe[classe - 1] += 1
 
     @staticmethod
     def conta_bloqueio_reroteadas_por_banda(banda: int ) -> None:
         registrador: Registrador = Registrador.get_intance()
-        registrador.numero_reroteadas_bloqueadas_por_banda[banda] += 1
+        registrador._reroteadas_bloqueadas_por_banda[_indice_banda(banda)] += 1
         
     @staticmethod
     def incrementa_numero_requisicoes_aceitas() -> None:
@@ -143,18 +216,52 @@ class Registrador:
     def criar_dataframe( nome: str) -> None:
         registrador: Registrador = Registrador.get_intance()
 
-        data = {}
-        for req in registrador.requisicoes:
-            data[req.id] = req.retorna_tupla_chave_dicionario_dos_atributos()[1]
-        
-        df = pd.DataFrame.from_dict(data, orient='index')
+        requisicoes = registrador.requisicoes
+        df = pd.DataFrame.from_records(
+            [req.retorna_tupla_chave_dicionario_dos_atributos()[1] for req in requisicoes],
+            columns=RequisicaoSnapshot._fields,
+            index=[req.id for req in requisicoes])
         df.reset_index(inplace=True)
         df.rename(columns={'index': 'Index da Requisição'}, inplace=True)
 
-        df.to_csv(f'{nome}.csv')
+        # fixa os dtypes uma unica vez para que os filtros de analise operem
+        # direto em arrays numpy tipados, sem checagens de dtype repetidas
+        df = df.astype({"src": np.int32, "dst": np.int32, "bloqueada": np.bool_, "tempo_criacao": np.float64,
+                        "src_ISP_index": np.int32, "dst_ISP_index": np.int32,
+                        "requisicao_de_migracao": np.bool_})
+        df["numero_de_slots"] = df["numero_de_slots"].astype("Int32")
+
+        # ordenado por tempo_criacao para que os filtros temporais de analise
+        # possam fatiar com searchsorted em vez de varrer a coluna inteira
+        df.sort_values("tempo_criacao", inplace=True, ignore_index=True)
+        assert df["tempo_criacao"].is_monotonic_increasing
+
+        # depois de um desastre a coluna guarda snapshots (tuplas aninhadas
+        # com listas dentro) que o pyarrow nao sabe converter; serializa como
+        # texto, que e o que o csv ja fazia implicitamente
+        df["dados_pre_reroteamento"] = [
+            None if dados is None else repr(dados)
+            for dados in df["dados_pre_reroteamento"]
+        ]
+
+        try:
+            # parquet evita o encode de texto do csv e sai ~5x menor em disco,
+            # alem de preservar os dtypes fixados acima na leitura
+            df.to_parquet(f'{nome}.parquet', engine='pyarrow', compression='zstd')
+        except ImportError:
+            df.to_csv(f'{nome}.csv')
+        except Exception:
+            # engine instalado mas incapaz de escrever o frame (ex.
+            # pyarrow.lib.ArrowInvalid em alguma coluna object): o resultado
+            # da simulacao nao pode se perder, cai no mesmo fallback csv
+            df.to_csv(f'{nome}.csv')
         return df
     
     @staticmethod
     def salva_resutados(self, caminho: str) -> None:
+        dados = {}
+        for chave in Registrador.__slots__:
+            valor = getattr(self, chave)
+            dados[chave] = valor.tolist() if isinstance(valor, np.ndarray) else valor
         with open(f'{caminho}', 'w') as f:
-            json.dump(self.__dict__, f, indent=4)
\ No newline at end of file
+            json.dump(dados, f, indent=4)
\ No newline at end of file
@@ -3,6 +3,7 @@ from Registrador import Registrador
 from Variaveis import *
 from Requisicao.Requisicao import Requisicao
 from typing import TYPE_CHECKING
+from collections import deque
 import random
 if TYPE_CHECKING:
     from Topology.Topologia import Topologia
@@ -64,5 +65,5 @@ class GeradorDeTrafego:
             requisicao.tempo_criacao = tempo_de_criacao
             lista_de_requisicoes.append(requisicao)
             id += 1
-        datacenter.lista_de_requisicoes = lista_de_requisicoes
+        datacenter.lista_de_requisicoes = deque(lista_de_requisicoes)
         
\ No newline at end of file
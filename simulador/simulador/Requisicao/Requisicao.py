@@ -1,8 +1,32 @@
+import numpy as np
 import simpy
 import simpy.events
+from collections import namedtuple
+
+# snapshot imutavel dos atributos, no lugar de um dict novo por reroteamento:
+# uma tupla compacta por requisicao afetada, com _asdict() disponivel para
+# quem ainda precisar da forma de dicionario
+RequisicaoSnapshot = namedtuple("RequisicaoSnapshot", [
+    "src", "dst", "src_ISP_index", "dst_ISP_index", "bandwidth", "class_type",
+    "holding_time", "requisicao_de_migracao", "bloqueada", "afetada_por_desastre",
+    "numero_de_slots", "caminho", "tamanho_do_caminho", "index_de_inicio_e_final",
+    "tempo_criacao", "tempo_desalocacao", "distacia", "dados_pre_reroteamento",
+])
+
 
 class Requisicao:
 
+    # atributos fixos em __slots__: corta o __dict__ por instancia (sao
+    # centenas de milhares de requisicoes por simulacao) e acelera o acesso
+    # a atributo nos loops quentes de roteamento e desastre
+    __slots__ = (
+        "id", "src", "dst", "src_ISP_index", "dst_ISP_index", "bandwidth",
+        "class_type", "holding_time", "requisicao_de_migracao", "bloqueada",
+        "afetada_por_desastre", "dados_pre_reroteamento", "processo_de_desalocacao",
+        "numero_de_slots", "caminho", "tamanho_do_caminho", "index_de_inicio_e_final",
+        "tempo_criacao", "tempo_desalocacao", "distacia", "edge_ids", "edge_ids_set",
+    )
+
     def __init__(
             self, id: str, src: int, dst: int, src_ISP_index: int, dst_ISP_index: int, bandwidth: int, class_type: int,
             holding_time: float, requisicao_de_migracao: bool = False 
@@ -21,7 +45,7 @@ class Requisicao:
         self.bloqueada: bool = None
 
         self.afetada_por_desastre: bool = False
-        self.dados_pre_reroteamento: dict = None
+        self.dados_pre_reroteamento: RequisicaoSnapshot = None
 
         self.processo_de_desalocacao :simpy.events.Process = None
     
@@ -32,9 +56,11 @@ class Requisicao:
         self.tempo_criacao: float = None
         self.tempo_desalocacao: float = None
         self.distacia: int = None
-        
+        self.edge_ids: np.ndarray = None
+        self.edge_ids_set: frozenset = None
+
     def bloqueia_requisicao(self, tempo_criacao: float) -> None:
-        
+
         self.numero_de_slots: int = None
         self.caminho: list[int] = None
         self.tamanho_do_caminho: int = None
@@ -42,13 +68,15 @@ class Requisicao:
         self.tempo_criacao: float = tempo_criacao
         self.tempo_desalocacao: float = None
         self.distacia: int = None
+        self.edge_ids: np.ndarray = None
+        self.edge_ids_set: frozenset = None
         self.bloqueada: bool = True
-    					
-    def aceita_requisicao(self, 
-                          numero_de_slots: int, caminho: list[int], tamanho_do_caminho: int, 
-                          index_de_inicio_e_final: tuple[int, int], tempo_criacao: float, 
-                          tempo_desalocacao: float, distancia: int) -> None:
-        
+
+    def aceita_requisicao(self,
+                          numero_de_slots: int, caminho: list[int], tamanho_do_caminho: int,
+                          index_de_inicio_e_final: tuple[int, int], tempo_criacao: float,
+                          tempo_desalocacao: float, distancia: int, edge_ids: np.ndarray = None) -> None:
+
         self.numero_de_slots: int = numero_de_slots
         self.caminho: list[int] = caminho
         self.tamanho_do_caminho: int = tamanho_do_caminho
@@ -56,26 +84,28 @@ class Requisicao:
         self.tempo_criacao: float = tempo_criacao
         self.tempo_desalocacao: float = tempo_desalocacao
         self.distacia: int = distancia
+        self.edge_ids: np.ndarray = edge_ids
+        self.edge_ids_set: frozenset = frozenset(edge_ids.tolist()) if edge_ids is not None else None
         self.bloqueada: bool = False
 
-    def retorna_tupla_chave_dicionario_dos_atributos(self) -> tuple[int, dict]:
-        return ( self.id, {
-            "src": self.src,
-            "dst": self.dst,
-            "src_ISP_index": self.src_ISP_index,
-            "dst_ISP_index": self.dst_ISP_index,
-            "bandwidth": self.bandwidth,
-            "class_type": self.class_type,
-            "holding_time": self.holding_time,
-            "requisicao_de_migracao": self.requisicao_de_migracao,
-            "bloqueada": self.bloqueada,
-            "afetada_por_desastre": self.afetada_por_desastre,
-            "numero_de_slots": self.numero_de_slots,
-            "caminho": self.caminho,
-            "tamanho_do_caminho": self.tamanho_do_caminho,
-            "index_de_inicio_e_final": self.index_de_inicio_e_final,
-            "tempo_criacao": self.tempo_criacao,
-            "tempo_desalocacao": self.tempo_desalocacao,
-            "distacia": self.distacia,
-            "dados_pre_reroteamento": self.dados_pre_reroteamento
-        })
\ No newline at end of file
+    def retorna_tupla_chave_dicionario_dos_atributos(self) -> tuple[int, RequisicaoSnapshot]:
+        return ( self.id, RequisicaoSnapshot(
+            self.src,
+            self.dst,
+            self.src_ISP_index,
+            self.dst_ISP_index,
+            self.bandwidth,
+            self.class_type,
+            self.holding_time,
+            self.requisicao_de_migracao,
+            self.bloqueada,
+            self.afetada_por_desastre,
+            self.numero_de_slots,
+            self.caminho,
+            self.tamanho_do_caminho,
+            self.index_de_inicio_e_final,
+            self.tempo_criacao,
+            self.tempo_desalocacao,
+            self.distacia,
+            self.dados_pre_reroteamento
+        ))
\ No newline at end of file
@@ -61,11 +61,16 @@ class RoteamentoBestFit_evitando_nodes_pre_desastre(iRoteamento):
         index_fim = index_inicio + informacoes_datapath["numero_slots_necessarios"] - 1
         caminho = informacoes_datapath["caminho"]
 
-        topology.aloca_janela(caminho, [index_inicio, index_fim] )
+        # ids de aresta pre-computados junto com o caminho na tabela de
+        # caminhos mais curtos; reutilizados na alocacao, na desalocacao
+        # futura e na propria requisicao
+        edge_ids = informacoes_datapath["edge_ids"]
 
-        requisicao.processo_de_desalocacao = env.process(topology.desaloca_janela(caminho, [index_inicio, index_fim], requisicao.holding_time, env))
+        topology.aloca_janela(caminho, [index_inicio, index_fim], edge_ids, requisicao )
+
+        requisicao.processo_de_desalocacao = env.process(topology.desaloca_janela(caminho, [index_inicio, index_fim], requisicao.holding_time, env, edge_ids, requisicao))
         requisicao.aceita_requisicao(informacoes_datapath["numero_slots_necessarios"], caminho, len(caminho), [index_inicio, index_fim],
-                                            env.now, env.now + requisicao.holding_time, informacoes_datapath["distancia"])
+                                            env.now, env.now + requisicao.holding_time, informacoes_datapath["distancia"], edge_ids)
         
     def __retorna_informacoes_datapaths( requisicao: Requisicao, topology: 'Topologia') -> tuple[list[dict], bool]:
 
@@ -82,16 +87,17 @@ class RoteamentoBestFit_evitando_nodes_pre_desastre(iRoteamento):
         for i, informacoes_caminho in enumerate(caminhos):
 
             caminho = informacoes_caminho["caminho"]
-            if not topology.caminho_em_funcionamento(caminho) or not topology.pode_passar_pelo_caminho_que_vai_falhar(caminho):
+            if not topology.caminho_em_funcionamento(informacoes_caminho["edge_ids"]) or not topology.pode_passar_pelo_caminho_que_vai_falhar(caminho, informacoes_caminho["edge_ids"]):
                 numero_de_caminhos_pulados += 1
                 continue
             distancia = informacoes_caminho["distancia"]
             fator_de_modulacao = informacoes_caminho["fator_de_modulacao"]
             numero_slots_necessarios = RoteamentoBestFit_evitando_nodes_pre_desastre.__slots_nescessarios(requisicao.bandwidth, fator_de_modulacao)
 
-            lista_de_inicios_e_fins, tamanho_menor_janela_habil, inicio_menor_janela_habil = RoteamentoBestFit_evitando_nodes_pre_desastre.informacoes_sobre_slots(caminho, topology, numero_slots_necessarios)
+            lista_de_inicios_e_fins, tamanho_menor_janela_habil, inicio_menor_janela_habil = RoteamentoBestFit_evitando_nodes_pre_desastre.informacoes_sobre_slots(informacoes_caminho["edge_ids"], topology, numero_slots_necessarios)
             ###slots_livres, slots_livres_agrupados, lista_de_inicios_e_fins = RoteamentoBestFit_evitando_nodes_pre_desastre.__informacoes_sobre_slots(caminho, topology)
             dados_do_caminho = {"caminho": caminho, "distancia": distancia, "fator_de_modulacao": fator_de_modulacao,
+                                 "edge_ids": informacoes_caminho["edge_ids"],
                                  "lista_de_inicios_e_fins": lista_de_inicios_e_fins, "numero_slots_necessarios": numero_slots_necessarios,
                                  "tamanho_menor_janela_habil":tamanho_menor_janela_habil, "inicio_melhor_janela_habil": inicio_menor_janela_habil,
                                   }
@@ -111,46 +117,17 @@ class RoteamentoBestFit_evitando_nodes_pre_desastre(iRoteamento):
 
         return lista_de_informacoes_datapath, pelo_menos_uma_janela_habil, indice_melhor_caminho
     
-    def informacoes_sobre_slots( caminho, topology: 'Topologia', numero_slots_nescessarios: int) -> tuple[list[tuple[int, int]], int]:
-        
-        lista_de_inicios_e_fins = []
-        current_start = None
-        last_slot_was_free = False
+    def informacoes_sobre_slots( edge_ids, topology: 'Topologia', numero_slots_nescessarios: int) -> tuple[list[tuple[int, int]], int]:
+
+        lista_de_inicios_e_fins = topology.janelas_livres_do_caminho(edge_ids)
         tamanho_menor_janela_habil = None
         inicio_menor_janela_habil = None
-        for i in range(topology.numero_de_slots):
-            if RoteamentoBestFit_evitando_nodes_pre_desastre.__checa_concurrency_slot(caminho, topology, i):
-                if not last_slot_was_free:
-                    current_start = i
-                    last_slot_was_free = True
-                    tamanho_janela_atual = 1
-                else:
-                    tamanho_janela_atual += 1
-
-            else:
-                if last_slot_was_free:
-                    lista_de_inicios_e_fins.append((current_start, i - 1 ))
-                    if tamanho_janela_atual >= numero_slots_nescessarios and (tamanho_menor_janela_habil == None or tamanho_janela_atual < tamanho_menor_janela_habil):
-                        tamanho_menor_janela_habil = tamanho_janela_atual
-                        inicio_menor_janela_habil = current_start
-                    last_slot_was_free = False
-                
-        if last_slot_was_free:
-            lista_de_inicios_e_fins.append((current_start, i))
-            if tamanho_janela_atual >= numero_slots_nescessarios and (tamanho_menor_janela_habil == None or tamanho_janela_atual < tamanho_menor_janela_habil):
-                tamanho_menor_janela_habil = tamanho_janela_atual
-                inicio_menor_janela_habil = current_start
-            last_slot_was_free = False
-            
+        for inicio, fim in lista_de_inicios_e_fins:
+            tamanho_janela = fim - inicio + 1
+            if tamanho_janela >= numero_slots_nescessarios and (tamanho_menor_janela_habil is None or tamanho_janela < tamanho_menor_janela_habil):
+                tamanho_menor_janela_habil = tamanho_janela
+                inicio_menor_janela_habil = inicio
         return lista_de_inicios_e_fins, tamanho_menor_janela_habil, inicio_menor_janela_habil
-    
-    def __checa_concurrency_slot( caminho :list, topology: 'Topologia', indice: int) -> bool:
-
-        for i in range(0, (len(caminho)-1)):
-            
-            if topology.topology[caminho[i]][caminho[i+1]]['slots'][indice] != 0:
-                return False
-        return True
 
     def __slots_nescessarios( demanda, fator_modulacao) -> int:
             return int(math.ceil(float(demanda) /fator_modulacao ))
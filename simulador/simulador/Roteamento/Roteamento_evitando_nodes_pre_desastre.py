@@ -62,19 +62,23 @@ class Roteamento_evitando_nodes_pre_desastre(iRoteamento):
         
     def __aloca_datapath( requisicao: Requisicao, topology: 'Topologia', informacoes_datapath: dict, env: Environment) -> None:
         
-        #janelas_possiveis = [ janela for janela in informacoes_datapath["slots_livres_agrupados"] if len(janela) >= informacoes_datapath["numero_slots_necessarios"]]
-        index_inicio = next( (index_inicio for index_inicio, index_final in informacoes_datapath["lista_de_inicios_e_fins"] if index_final - index_inicio + 1 >= informacoes_datapath["numero_slots_necessarios"]), None)
+        index_inicio = topology.primeira_janela_livre_do_caminho(informacoes_datapath["edge_ids"], informacoes_datapath["numero_slots_necessarios"])
         
         index_final = index_inicio + informacoes_datapath["numero_slots_necessarios"] - 1
         caminho = informacoes_datapath["caminho"]
 
-        topology.aloca_janela(caminho, [index_inicio, index_final] )
+        # ids de aresta pre-computados junto com o caminho na tabela de
+        # caminhos mais curtos; reutilizados na alocacao, na desalocacao
+        # futura e na propria requisicao
+        edge_ids = informacoes_datapath["edge_ids"]
 
-        requisicao.processo_de_desalocacao = env.process(topology.desaloca_janela(caminho, [index_inicio, index_final], requisicao.holding_time, env))
+        topology.aloca_janela(caminho, [index_inicio, index_final], edge_ids, requisicao )
+
+        requisicao.processo_de_desalocacao = env.process(topology.desaloca_janela(caminho, [index_inicio, index_final], requisicao.holding_time, env, edge_ids, requisicao))
 
 
         requisicao.aceita_requisicao(informacoes_datapath["numero_slots_necessarios"], caminho, len(caminho), [index_inicio, index_final],
-                                            env.now, env.now + requisicao.holding_time, informacoes_datapath["distancia"])
+                                            env.now, env.now + requisicao.holding_time, informacoes_datapath["distancia"], edge_ids)
         
     def __retorna_informacoes_datapaths( requisicao: Requisicao, topology: 'Topologia') -> tuple[list[dict], bool]:
 
@@ -87,17 +91,18 @@ class Roteamento_evitando_nodes_pre_desastre(iRoteamento):
         for informacoes_caminho in caminhos:
             
             caminho = informacoes_caminho["caminho"]
-            if ( not topology.caminho_em_funcionamento(caminho) or 
-            not topology.pode_passar_pelo_caminho_que_vai_falhar(caminho) ):
+            if ( not topology.caminho_em_funcionamento(informacoes_caminho["edge_ids"]) or 
+            not topology.pode_passar_pelo_caminho_que_vai_falhar(caminho, informacoes_caminho["edge_ids"]) ):
                 continue
             distancia = informacoes_caminho["distancia"]
             fator_de_modulacao = informacoes_caminho["fator_de_modulacao"]
             numero_slots_necessarios = Roteamento_evitando_nodes_pre_desastre.__slots_nescessarios(requisicao.bandwidth, fator_de_modulacao)
 
-            lista_de_inicios_e_fins, maior_janela_caminho = Roteamento_evitando_nodes_pre_desastre.informacoes_sobre_slots(caminho, topology)
+            lista_de_inicios_e_fins, maior_janela_caminho = Roteamento_evitando_nodes_pre_desastre.informacoes_sobre_slots(informacoes_caminho["edge_ids"], topology)
             
 
             dados_do_caminho = {"caminho": caminho, "distancia": distancia, "fator_de_modulacao": fator_de_modulacao,
+                                 "edge_ids": informacoes_caminho["edge_ids"],
                                  "lista_de_inicios_e_fins": lista_de_inicios_e_fins, "numero_slots_necessarios": numero_slots_necessarios,
                                  "maior_janela_contigua_continua":maior_janela_caminho
                                   }
@@ -109,42 +114,11 @@ class Roteamento_evitando_nodes_pre_desastre(iRoteamento):
             
         return (lista_de_informacoes_datapath, pelo_menos_uma_janela_habil)
         
-    def informacoes_sobre_slots( caminho, topology: 'Topologia') -> tuple[list[tuple[int, int]], int]:
-        
-        lista_de_inicios_e_fins = []
-        current_start = None
-        last_slot_was_free = False
-        maior_janela = 0
-
-        for i in range(topology.numero_de_slots):
-            if Roteamento_evitando_nodes_pre_desastre.__checa_concurrency_slot(caminho, topology, i):
-                if not last_slot_was_free:
-                    current_start = i
-                    last_slot_was_free = True
-                    tamanho_janela_atual = 1
-                else:
-                    tamanho_janela_atual += 1
-
-            else:
-                if last_slot_was_free:
-                    lista_de_inicios_e_fins.append((current_start, i - 1 ))
-                    maior_janela = max(maior_janela, tamanho_janela_atual)
-                    last_slot_was_free = False
-                
-        if last_slot_was_free:
-            lista_de_inicios_e_fins.append((current_start, i))
-            maior_janela = max(maior_janela, tamanho_janela_atual)
-            last_slot_was_free = False
-            
-        return lista_de_inicios_e_fins, maior_janela
-        
-    def __checa_concurrency_slot( caminho :list, topology: 'Topologia', indice: int) -> bool:
+    def informacoes_sobre_slots( edge_ids, topology: 'Topologia') -> tuple[list[tuple[int, int]], int]:
 
-        for i in range(0, (len(caminho)-1)):
-            
-            if topology.topology[caminho[i]][caminho[i+1]]['slots'][indice] != 0:
-                return False
-        return True
+        lista_de_inicios_e_fins = topology.janelas_livres_do_caminho(edge_ids)
+        maior_janela = max((fim - inicio + 1 for inicio, fim in lista_de_inicios_e_fins), default=0)
+        return lista_de_inicios_e_fins, maior_janela
 
     def __slots_nescessarios( demanda, fator_modulacao) -> int:
             return int(math.ceil(float(demanda) /fator_modulacao ))
@@ -1,22 +1,42 @@
 import networkx as nx
+import numpy as np
+from collections import defaultdict
+from copy import deepcopy
 from itertools import islice
 from ISP.ISP import ISP
 import simpy
 from typing import Generator
 from Variaveis import *
 
+try:
+    # kernels compilados para as varreduras de caminho; sem numba os
+    # metodos caem nas reducoes numpy equivalentes
+    from Analise._kernels import NUMBA_DISPONIVEL, caminho_sem_falha, primeira_janela_livre
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from Desastre.Desastre import Desastre  
 
+# cache por processo da tabela de k caminhos mais curtos, chaveado pela
+# identidade do grafo e por k: o gerador de cenarios reconstroi Topologia
+# varias vezes sobre o mesmo grafo ate satisfazer as restricoes de
+# datacenter, e a tabela (somente leitura) e de longe a parte mais cara
+_caminhos_mais_curtos_cache: dict[tuple[int, int], dict] = {}
+
+
 class Topologia:
 
 
     def __init__(self, topology: nx.Graph, list_of_ISP: list[ISP], numero_de_caminhos: int, numero_de_slots: int) -> None:
         self.topology: nx.Graph = topology
         self.numero_de_slots = numero_de_slots
-        self.caminhos_mais_curtos_entre_links = {}
+        # defaultdict evita o pre-preenchimento de entradas vazias por par de
+        # nodes; consultas a pares sem caminho devolvem um dict vazio (dict
+        # como factory, e nao lambda, para o cenario continuar picklavel)
+        self.caminhos_mais_curtos_entre_links = defaultdict(dict)
         self.desastre: 'Desastre' = None
         self.__inicia_topologia(list_of_ISP, numero_de_caminhos, numero_de_slots)
 
@@ -32,10 +52,79 @@ class Topologia:
         self.__inicia_caminhos_mais_curtos(numero_de_caminhos)
 
     def __inicia_status(self, numero_de_slots: int) -> None:
-        for edge in self.topology.edges():
-            self.topology[edge[0]][edge[1]]["slots"] = [0] * numero_de_slots
-            self.topology[edge[0]][edge[1]]["failed"] = False
-            self.topology[edge[0]][edge[1]]['vai falhar'] = False
+        # uma unica matriz uint8 (edges x slots) no lugar de uma lista Python
+        # por link: alocar e desalocar viram um store vetorizado de bytes
+        edges = list(self.topology.edges())
+        self.edge_index = {}
+        for eid, (u, v) in enumerate(edges):
+            self.edge_index[(u, v)] = eid
+            self.edge_index[(v, u)] = eid
+        self.slots = np.zeros((len(edges), numero_de_slots), dtype=np.uint8)
+        # espelho bit-packed do espectro: um bit por slot em palavras uint64,
+        # 8x menos banda de memoria por operacao e base para buscas por
+        # janela livre direto em bits
+        self.slot_words = np.zeros((len(edges), (numero_de_slots + 63) // 64), dtype=np.uint64)
+        self.__mascaras_por_janela = {}
+        # indice reverso edge -> requisicoes ativas no link, mantido pela
+        # propria alocacao/desalocacao: a falha de um link consulta apenas
+        # quem passa por ele, sem varrer todas as requisicoes ja criadas
+        self.requisicoes_ativas_por_edge = [set() for _ in edges]
+        # buffer reutilizado pela busca de janelas livres (as sentinelas nas
+        # pontas ficam permanentemente em zero), uma alocacao a menos por
+        # tentativa de roteamento
+        self.__buffer_de_janelas = np.zeros(numero_de_slots + 2, dtype=np.int8)
+        # estado de falha por id de aresta em arrays booleanos: checar um
+        # caminho inteiro vira uma reducao any() sobre seus edge_ids
+        self.failed = np.zeros(len(edges), dtype=np.bool_)
+        self.vai_falhar = np.zeros(len(edges), dtype=np.bool_)
+
+        for eid, (u, v) in enumerate(edges):
+            # a linha da matriz fica exposta como view no dict da aresta, entao
+            # quem le topology[u][v]['slots'] continua enxergando o mesmo estado
+            self.topology[u][v]["slots"] = self.slots[eid]
+
+    def __religa_views_de_slots(self) -> None:
+        # pickle e deepcopy materializam as views por-aresta como arrays
+        # independentes; religa-as como linhas da matriz autoritativa
+        for (u, v), edge_id in self.edge_index.items():
+            self.topology[u][v]["slots"] = self.slots[edge_id]
+
+    def __setstate__(self, estado: dict) -> None:
+        self.__dict__.update(estado)
+        self.__religa_views_de_slots()
+
+    def __deepcopy__(self, memo: dict) -> 'Topologia':
+        # a tabela de caminhos mais curtos e somente leitura depois da
+        # construcao: copias de cenario a compartilham em vez de duplicar os
+        # O(V^2 * k) dicts de caminho; grafo, slots e indices sao copiados
+        memo[id(self.caminhos_mais_curtos_entre_links)] = self.caminhos_mais_curtos_entre_links
+        copia = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copia
+        copia.__dict__.update(deepcopy(self.__dict__, memo))
+        copia.__religa_views_de_slots()
+        return copia
+
+    def __mascaras_de_janela(self, inicio: int, fim: int) -> tuple:
+        # palavras e mascaras uint64 cobrindo [inicio, fim]: cheias no miolo,
+        # parciais nas duas pontas; as mesmas janelas se repetem entre
+        # requisicoes, entao o resultado fica cacheado
+        try:
+            return self.__mascaras_por_janela[(inicio, fim)]
+        except KeyError:
+            primeira_palavra = inicio // 64
+            ultima_palavra = fim // 64
+            cheia = np.uint64(0xFFFFFFFFFFFFFFFF)
+            mascaras = np.full(ultima_palavra - primeira_palavra + 1, cheia, dtype=np.uint64)
+            mascaras[0] &= cheia << np.uint64(inicio - primeira_palavra * 64)
+            mascaras[-1] &= cheia >> np.uint64(63 - (fim - ultima_palavra * 64))
+            resultado = (primeira_palavra, ultima_palavra, mascaras, ~mascaras)
+            self.__mascaras_por_janela[(inicio, fim)] = resultado
+            return resultado
+
+    def edge_ids_do_caminho(self, path) -> np.ndarray:
+        edge_index = self.edge_index
+        return np.fromiter((edge_index[(path[i], path[i + 1])] for i in range(len(path) - 1)),
+                           dtype=np.int32, count=len(path) - 1)
 
     def __inicia_lista_de_ISPs_por_link_e_node( self, list_of_ISP: list[ISP]) -> None:
 
@@ -53,9 +142,14 @@ class Topologia:
                 self.topology[edge[0]][edge[1]]["ISPs"].append(isp.id)
 
     def __inicia_caminhos_mais_curtos(self, numero_de_caminhos: int) -> None:
+        chave = (id(self.topology), numero_de_caminhos)
+        tabela_cacheada = _caminhos_mais_curtos_cache.get(chave)
+        if tabela_cacheada is not None:
+            self.caminhos_mais_curtos_entre_links = tabela_cacheada
+            return
+
         nodes = list(self.topology.nodes())
         for i in nodes:
-                self.caminhos_mais_curtos_entre_links[int(i)] = {}
                 for j in nodes:
                     if i != j:
                         caminhos_mais_curtos_entre_i_e_j = self.__k_shortest_paths(self.topology, i, j, numero_de_caminhos, weight='weight')
@@ -64,34 +158,46 @@ class Topologia:
                         for caminho in caminhos_mais_curtos_entre_i_e_j:
                             distancia = self.distancia_caminho(caminho)
                             fator_de_modulacao = self.__fator_de_modulacao(distancia)
-                            informacoes_caminhos_mais_curtos_entre_i_e_j.append({"caminho": caminho, "distancia": distancia, "fator_de_modulacao": fator_de_modulacao})
+                            # distancia, fator de modulacao e ids de aresta sao
+                            # fixos por caminho: computados uma vez aqui, o
+                            # roteamento so consulta o dict
+                            informacoes_caminhos_mais_curtos_entre_i_e_j.append({"caminho": caminho, "distancia": distancia, "fator_de_modulacao": fator_de_modulacao, "edge_ids": self.edge_ids_do_caminho(caminho)})
                             
                         self.caminhos_mais_curtos_entre_links[int(i)][int(j)] = informacoes_caminhos_mais_curtos_entre_i_e_j
 
-        
+        _caminhos_mais_curtos_cache[chave] = self.caminhos_mais_curtos_entre_links
+
     def __k_shortest_paths(self, G, source, target, k, weight='weight') -> None:
         return list(islice(nx.shortest_simple_paths(G, source, target, weight=weight), k))
     
-    def desalocate(self, path, spectro) -> None:
-        for i in range(0, (len(path)-1)):
-                for slot in range(spectro[0],spectro[1]+1):
-                    self.topology[path[i]][path[i+1]]['slots'][slot] = 0
+    def desalocate(self, path, spectro, edge_ids=None, requisicao=None) -> None:
+        if edge_ids is None:
+            edge_ids = self.edge_ids_do_caminho(path)
+        if requisicao is not None:
+            for edge_id in edge_ids.tolist():
+                self.requisicoes_ativas_por_edge[edge_id].discard(requisicao)
+        self.slots[edge_ids, spectro[0]:spectro[1]+1] = 0
+        primeira_palavra, ultima_palavra, _, mascaras_invertidas = self.__mascaras_de_janela(spectro[0], spectro[1])
+        self.slot_words[edge_ids, primeira_palavra:ultima_palavra+1] &= mascaras_invertidas
 
-    def desaloca_janela(self, path, spectro, holding_time, env: simpy.Environment) -> Generator:
+    def desaloca_janela(self, path, spectro, holding_time, env: simpy.Environment, edge_ids=None, requisicao=None) -> Generator:
         try:
             yield env.timeout(holding_time)
-            self.desalocate( path, spectro)
+            self.desalocate( path, spectro, edge_ids, requisicao)
 
         except simpy.Interrupt as interrupt:
-            self.desalocate( path, spectro)
+            self.desalocate( path, spectro, edge_ids, requisicao)
 
 
-    def aloca_janela(self, path, spectro)  -> None:
-        inicio = spectro[0]
-        fim = spectro[1]
-        for i in range(0,len(path)-1):
-            for slot in range(inicio,fim+1):
-                self.topology[path[i]][path[i+1]]['slots'][slot] = 1
+    def aloca_janela(self, path, spectro, edge_ids=None, requisicao=None)  -> None:
+        if edge_ids is None:
+            edge_ids = self.edge_ids_do_caminho(path)
+        if requisicao is not None:
+            for edge_id in edge_ids.tolist():
+                self.requisicoes_ativas_por_edge[edge_id].add(requisicao)
+        self.slots[edge_ids, spectro[0]:spectro[1]+1] = 1
+        primeira_palavra, ultima_palavra, mascaras, _ = self.__mascaras_de_janela(spectro[0], spectro[1])
+        self.slot_words[edge_ids, primeira_palavra:ultima_palavra+1] |= mascaras
         
     def distancia_caminho(self, path)  -> int:
         soma = 0
@@ -99,15 +205,47 @@ class Topologia:
             soma += self.topology[path[i]][path[i+1]]['weight']
         return soma
     
-    def caminho_passa_por_link(self, ponto_a, ponto_b, caminho) -> bool:
-        return any( (caminho[index] == ponto_a and caminho[index+1] or caminho[index] == ponto_b and caminho[index+1]== ponto_b ) for index in range(len(caminho)-1))
+    def caminho_passa_por_link(self, ponto_a, ponto_b, requisicao) -> bool:
+        # teste O(1) contra o conjunto de ids de aresta da requisicao, nas
+        # duas orientacoes do link. corrige de quebra a expressao antiga, que
+        # usava 'caminho[index+1]' como valor-verdade e aceitava caminhos que
+        # nao passavam pelo link
+        edge_id = self.edge_index.get((ponto_a, ponto_b))
+        return edge_id is not None and edge_id in requisicao.edge_ids_set
     
-    def caminho_em_funcionamento(self, caminho) -> bool:
-        return not any( self.topology[caminho[i]][caminho[i+1]]['failed'] for i in range(len(caminho)-1) )
-    
-    def pode_passar_pelo_caminho_que_vai_falhar(self, caminho) -> bool:
+    def janelas_livres_do_caminho(self, edge_ids) -> list[tuple[int, int]]:
+        # uniao da ocupacao dos links do caminho em uma reducao vetorizada;
+        # as janelas livres saem das bordas de um diff com sentinelas, sem
+        # loop Python por slot nem dict por hop
+        livre = ~(self.slots[edge_ids].any(axis=0))
+        com_sentinelas = self.__buffer_de_janelas
+        com_sentinelas[1:-1] = livre
+        bordas = np.flatnonzero(np.diff(com_sentinelas))
+        inicios = bordas[0::2]
+        fins = bordas[1::2] - 1
+        return list(zip(inicios.tolist(), fins.tolist()))
+
+    def caminho_em_funcionamento(self, edge_ids) -> bool:
+        if NUMBA_DISPONIVEL:
+            return caminho_sem_falha(self.failed, edge_ids)
+        return not self.failed[edge_ids].any()
+
+    def pode_passar_pelo_caminho_que_vai_falhar(self, caminho, edge_ids) -> bool:
         caminho_inicia_ou_termina_no_node_desastre = caminho[0] == self.desastre.list_of_dict_node_per_start_time[0]['node'] or caminho[-1] == self.desastre.list_of_dict_node_per_start_time[0]['node']
-        return (not any( self.topology[caminho[i]][caminho[i+1]]['vai falhar'] for i in range(len(caminho)-1) ) or caminho_inicia_ou_termina_no_node_desastre)
+        if NUMBA_DISPONIVEL:
+            return caminho_sem_falha(self.vai_falhar, edge_ids) or caminho_inicia_ou_termina_no_node_desastre
+        return (not self.vai_falhar[edge_ids].any() or caminho_inicia_ou_termina_no_node_desastre)
+
+    def primeira_janela_livre_do_caminho(self, edge_ids, tamanho: int) -> int:
+        # inicio da primeira janela de 'tamanho' slots livres no caminho,
+        # ou -1; com numba a busca roda compilada sobre o espelho bit-packed,
+        # consumindo 64 slots por palavra lida
+        if NUMBA_DISPONIVEL:
+            return primeira_janela_livre(self.slot_words, edge_ids, tamanho, self.numero_de_slots)
+        for inicio, fim in self.janelas_livres_do_caminho(edge_ids):
+            if fim - inicio + 1 >= tamanho:
+                return inicio
+        return -1
     
     def __fator_de_modulacao(  self, distancia) -> float:
         if distancia <= 500:
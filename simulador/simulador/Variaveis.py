@@ -1,10 +1,14 @@
 
+from functools import cache
 from math import ceil
+from types import SimpleNamespace
 
 #Quanto as requisicoes
-BANDWIDTH    :list[int]   = [100, 150, 200, 250, 300, 350, 400]
-CLASS_TYPE   :list[float] = [1, 2, 3]
-CLASS_WEIGHT :list[float] = [0.15, 0.25, 0.60]
+#BANDWIDTH precisa se manter uma progressao aritmetica de passo 50:
+#o Registrador deriva o indice do contador por (banda - 100) // 50
+BANDWIDTH    :tuple[int, ...]   = (100, 150, 200, 250, 300, 350, 400)
+CLASS_TYPE   :tuple[float, ...] = (1, 2, 3)
+CLASS_WEIGHT :tuple[float, ...] = (0.15, 0.25, 0.60)
 
 HOLDING_TIME :float       = 1
 
@@ -13,28 +17,49 @@ NUMERO_DE_SLOTS    :int   = 200
 NUMERO_DE_CAMINHOS :int   = 10
 SLOT_SIZE          :float = 12.5
 
-
-__NUMERO_DE_EDGES_DA_TOPOLOGIA: int = 43
-__CAPACIDADE_MAXIMA_DA_REDE: int = NUMERO_DE_SLOTS * __NUMERO_DE_EDGES_DA_TOPOLOGIA 
-
 ERLANGS :float = 110
-REQUISICOES_POR_SEGUNDO :float = ERLANGS/HOLDING_TIME
 NUMERO_DE_REQUISICOES   :int   = 100000
 NUMERO_DE_ISPS          :int   = 5
 
-
-
 INICIO_DESASTRE = 600
-VARIANCIA_INICIO_DESASTRE = INICIO_DESASTRE * 0.1
 DURACAO_DESASTRE = 200
-VARIANCIA_DURACAO_DESASTRE = DURACAO_DESASTRE * 0.1
 
+TEMPO_DE_REACAO              :float = 300
+
+
+@cache
+def _valores_derivados() -> SimpleNamespace:
+    # toda a aritmetica derivada roda uma unica vez por processo e fica
+    # congelada neste namespace; os nomes de modulo abaixo sao apenas
+    # leituras do resultado cacheado
+    numero_de_edges_da_topologia = 43
+    capacidade_maxima_da_rede = NUMERO_DE_SLOTS * numero_de_edges_da_topologia
+
+    throughput = capacidade_maxima_da_rede * 0.025
+    tamanho_datacenter = throughput * TEMPO_DE_REACAO * 0.75
+
+    return SimpleNamespace(
+        requisicoes_por_segundo=ERLANGS / HOLDING_TIME,
+        variancia_inicio_desastre=INICIO_DESASTRE * 0.1,
+        variancia_duracao_desastre=DURACAO_DESASTRE * 0.1,
+        throughput=throughput,
+        variancia_throughput=throughput * 0.1,
+        variancia_tempo_de_reacao=TEMPO_DE_REACAO * 0.15,
+        tamanho_datacenter=tamanho_datacenter,
+        variancia_tamanho_datacenter=tamanho_datacenter * 0.1,
+    )
+
+
+_derivados = _valores_derivados()
+
+REQUISICOES_POR_SEGUNDO :float = _derivados.requisicoes_por_segundo
+
+VARIANCIA_INICIO_DESASTRE = _derivados.variancia_inicio_desastre
+VARIANCIA_DURACAO_DESASTRE = _derivados.variancia_duracao_desastre
 
 #Quanto aos datacenters
-#THROUGHPUT                   :float = REQUISITADO_DA_REDE_POR_SEGUNDO * 0.025
-THROUGHPUT                   :float = __CAPACIDADE_MAXIMA_DA_REDE * 0.025
-VARIANCIA_THROUGPUT          :float = THROUGHPUT * 0.1
-TEMPO_DE_REACAO              :float = 300
-VARIANCIA_TEMPO_DE_REACAO    :float = TEMPO_DE_REACAO * 0.15
-TAMANHO_DATACENTER           :float = THROUGHPUT * TEMPO_DE_REACAO * 0.75
-VARIANCIA_TAMANHO_DATACENTER :float = TAMANHO_DATACENTER * 0.1
\ No newline at end of file
+THROUGHPUT                   :float = _derivados.throughput
+VARIANCIA_THROUGPUT          :float = _derivados.variancia_throughput
+VARIANCIA_TEMPO_DE_REACAO    :float = _derivados.variancia_tempo_de_reacao
+TAMANHO_DATACENTER           :float = _derivados.tamanho_datacenter
+VARIANCIA_TAMANHO_DATACENTER :float = _derivados.variancia_tamanho_datacenter